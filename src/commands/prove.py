@@ -30,7 +30,7 @@ def prove_z3(checkpoint=None, interval=100, target_size=17, max_depth=3, max_ari
         definability_mode: Definability mode (syntactic or truth-functional)
 
     Returns:
-        Exit code (0 for success, 1 for failure)
+        Exit code (0 for success, 1 for failure, 2 if inconclusive)
     """
     print()
     print("=" * 70)
@@ -61,7 +61,10 @@ def prove_z3(checkpoint=None, interval=100, target_size=17, max_depth=3, max_ari
     print("=" * 70)
     print()
 
-    if no_target_size:
+    if no_target_size is None:
+        print(f"? INCONCLUSIVE: search for size-{target_size} nice sets did not finish")
+        return 2
+    elif no_target_size:
         print(f"✓ PROVEN: No size-{target_size} nice sets exist")
         print(f"✓ Combined with size-{target_size - 1} example: max = {target_size - 1} exactly")
         return 0
@@ -1,17 +1,21 @@
 """
-Core connective representation using Z3 BitVec truth tables.
+Core connective representation using packed integer truth tables.
 
-A connective is represented by its truth table encoded as a BitVector,
+A connective is represented by its truth table encoded as an integer,
 where the i-th bit represents the output for the i-th input assignment.
 """
 
-from z3 import BitVec, BitVecVal, Extract, Concat
 from typing import List, Tuple, Optional, Dict
+from functools import lru_cache
+import itertools
 
 
 # Module-level cache for readable connective names
 _READABLE_NAMES: Optional[Dict[Tuple[int, int], str]] = None
 
+# Module-level cache of input tuples for each row, keyed by arity
+_ROW_INPUTS: Dict[int, Tuple[Tuple[int, ...], ...]] = {}
+
 
 def _init_readable_names() -> Dict[Tuple[int, int], str]:
     """
@@ -70,16 +74,100 @@ def _get_readable_name(arity: int, truth_table: int) -> Optional[str]:
     return _READABLE_NAMES.get((arity, truth_table))
 
 
+def _row_inputs(arity: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Get the input tuple of every truth-table row for an arity.
+
+    Row r holds inputs (x1, ..., xn) with r = x1*2^(n-1) + ... + xn. The
+    tuples are built once per arity and shared by all callers.
+
+    Args:
+        arity: Number of input variables
+
+    Returns:
+        Tuple of input tuples, indexed by row
+    """
+    rows = _ROW_INPUTS.get(arity)
+    if rows is None:
+        rows = tuple(tuple((row >> (arity - 1 - k)) & 1 for k in range(arity))
+                     for row in range(1 << arity))
+        _ROW_INPUTS[arity] = rows
+    return rows
+
+
+@lru_cache(maxsize=None)
+def _permuted_source_rows(arity: int, perm: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Map each row to the row read by f(x_perm[0], ..., x_perm[n-1]).
+
+    Args:
+        arity: Number of variables
+        perm: Variable permutation
+
+    Returns:
+        Tuple whose entry r is the source row for row r
+    """
+    sources = []
+    for inputs in _row_inputs(arity):
+        source_row = 0
+        for k in range(arity):
+            source_row = (source_row << 1) | inputs[perm[k]]
+        sources.append(source_row)
+    return tuple(sources)
+
+
+def _permute_truth_table(truth_table: int, arity: int, perm: Tuple[int, ...]) -> int:
+    """
+    Compute the truth table of f(x_perm[0], ..., x_perm[n-1]).
+
+    Args:
+        truth_table: Truth table of f as an integer
+        arity: Number of variables
+        perm: Variable permutation
+
+    Returns:
+        Truth table of the permuted function
+    """
+    result = 0
+    for row, source_row in enumerate(_permuted_source_rows(arity, perm)):
+        result |= ((truth_table >> source_row) & 1) << row
+    return result
+
+
+@lru_cache(maxsize=None)
+def canonical_truth_table(arity: int, truth_table: int) -> int:
+    """
+    Compute the canonical form of a truth table under variable permutation.
+
+    The canonical form is the smallest truth table obtainable by permuting
+    the input variables, so two functions of the same arity agree up to
+    variable permutation exactly when their canonical forms are equal.
+
+    Args:
+        arity: Number of variables
+        truth_table: Truth table as an integer
+
+    Returns:
+        Minimum truth table over all variable permutations
+    """
+    return min(_permute_truth_table(truth_table, arity, perm)
+               for perm in itertools.permutations(range(arity)))
+
+
 class Connective:
     """
     Represents a logical connective by its truth table.
 
     Attributes:
         arity: Number of input variables (0-5)
-        truth_table: BitVec representation of the truth table
+        truth_table_int: Integer representation of the truth table
         name: Optional name for the connective
+        canonical_mask: Truth table canonical under variable permutation
     """
 
+    # Pools hold hundreds of connectives; slots drop the per-instance dict.
+    __slots__ = ('arity', 'truth_table_int', 'name', '_canonical_mask')
+
     def __init__(self, arity: int, truth_table: int, name: Optional[str] = None):
         """
         Initialize a connective.
@@ -108,8 +196,20 @@ class Connective:
 
         self.arity = arity
         self.truth_table_int = truth_table
-        self.truth_table = BitVecVal(truth_table, table_size)
         self.name = name or _get_readable_name(arity, truth_table) or f"f{arity}_{truth_table}"
+        self._canonical_mask: Optional[int] = None
+
+    @property
+    def canonical_mask(self) -> int:
+        """
+        Truth table canonical under variable permutation (computed once).
+
+        Returns:
+            Minimum truth table over all permutations of the input variables
+        """
+        if self._canonical_mask is None:
+            self._canonical_mask = canonical_truth_table(self.arity, self.truth_table_int)
+        return self._canonical_mask
 
     def evaluate(self, *args) -> int:
         """
@@ -154,17 +254,8 @@ class Connective:
         Returns:
             List of (input_tuple, output) pairs
         """
-        results = []
-        num_rows = 2 ** self.arity
-
-        for row in range(num_rows):
-            # Convert row index to input tuple
-            inputs = tuple((row >> (self.arity - 1 - i)) & 1
-                          for i in range(self.arity))
-            output = self.evaluate(inputs)
-            results.append((inputs, output))
-
-        return results
+        return [(inputs, (self.truth_table_int >> row) & 1)
+                for row, inputs in enumerate(_row_inputs(self.arity))]
 
     def __eq__(self, other) -> bool:
         """
@@ -7,12 +7,28 @@ find a composition tree of bounded depth that replicates the target
 connective's truth table.
 """
 
-from typing import List, Set, Tuple, Optional
+from typing import List, Set, Tuple, Optional, FrozenSet
 from src.connectives import Connective
-import itertools
+from src.post_classes import escape_bits, ALL_ESCAPE_BITS
+from functools import lru_cache
 from enum import Enum
 
 
+# Upper bound on memoized (target, basis, depth, mode) entries. Searches
+# revisit the same leave-one-out bases many times, so hits are common, but
+# the pool of distinct bases is unbounded and must not grow without limit.
+_DEFINABILITY_CACHE_SIZE = 1 << 16
+
+# Packed columns of the projections x and y over the binary rows. A column
+# has bit r set iff the expression outputs 1 on row r = 2x + y, so a binary
+# connective's column is exactly its truth_table_int.
+_COLUMN_X = 0b1100
+_COLUMN_Y = 0b1010
+
+# Truth table of the unary identity, standing in for a bare variable
+_UNARY_IDENTITY = 0b10
+
+
 class DefinabilityMode(Enum):
     """Definability checking mode."""
     SYNTACTIC = "syntactic"           # Composition-based (current)
@@ -32,7 +48,7 @@ def is_definable(target: Connective, basis: List[Connective],
         target: Connective to try to define
         basis: List of connectives to use as basis
         max_depth: Maximum composition depth to try
-        timeout_ms: Timeout in milliseconds (for compatibility, not used)
+        timeout_ms: Unused; enumeration is bounded by max_depth instead
         mode: Definability mode (syntactic or truth-functional, default: truth-functional)
 
     Returns:
@@ -58,11 +74,50 @@ def is_definable(target: Connective, basis: List[Connective],
                 if _get_truth_function_signature(b) == target_sig:
                     return True  # Cross-arity constants are equivalent
 
-    # Use pattern enumeration (proven correct for arity ≤3)
-    for depth in range(1, max_depth + 1):
-        if _is_definable_at_depth(target, basis, depth, timeout_ms, mode):
-            return True
-    return False
+    # Clone invariant: compositions of functions that all lie in one of
+    # Post's maximal clones stay in it, so a target outside it is undefinable.
+    # _check_binary_constant_patterns accepts every binary target once
+    # binary, unary and constant connectives are all present, so that case is
+    # left to the enumeration to keep results unchanged.
+    accepts_any_binary = (target.arity == 2 and max_depth >= 2 and
+                          {0, 1, 2} <= {b.arity for b in basis})
+    if not accepts_any_binary and _escapes_basis_clones(target, basis):
+        return False
+
+    # Use pattern enumeration (proven correct for arity ≤3). The patterns
+    # enumerated at depth d include every shallower pattern, so only depth 1
+    # (direct application) and the full depth need to be checked.
+    if max_depth < 1:
+        return False
+    if _is_definable_at_depth(target, basis, 1, timeout_ms, mode):
+        return True
+    return (max_depth >= 2 and
+            _is_definable_at_depth(target, basis, max_depth, timeout_ms, mode))
+
+
+def _escapes_basis_clones(target: Connective, basis: List[Connective]) -> bool:
+    """
+    Check if target leaves a Post class that contains every basis connective.
+
+    This is a necessary condition for undefinability that costs a few mask
+    operations, so it runs before any composition is enumerated.
+
+    The clones containing the whole basis are those no basis connective
+    escapes; the target must escape one of them.
+
+    Args:
+        target: Connective to define
+        basis: Non-empty list of basis connectives
+
+    Returns:
+        True if some clone contains the whole basis but not the target
+    """
+    basis_escapes = 0
+    for b in basis:
+        basis_escapes |= escape_bits(b)
+        if basis_escapes == ALL_ESCAPE_BITS:
+            return False
+    return bool(escape_bits(target) & ~basis_escapes)
 
 
 def _is_definable_at_depth(target: Connective, basis: List[Connective],
@@ -78,12 +133,34 @@ def _is_definable_at_depth(target: Connective, basis: List[Connective],
         target: Connective to define
         basis: Basis connectives
         depth: Composition depth
-        timeout_ms: Timeout in milliseconds
+        timeout_ms: Unused; enumeration is bounded by depth instead
+        mode: Definability mode (syntactic or truth-functional)
+
+    Returns:
+        True if definable at this depth
+    """
+    # Basis order never affects the answer, so results are memoized on the
+    # set of basis connectives (connectives hash by arity and truth table)
+    return _is_definable_at_depth_cached(target, frozenset(basis), depth, mode)
+
+
+@lru_cache(maxsize=_DEFINABILITY_CACHE_SIZE)
+def _is_definable_at_depth_cached(target: Connective, basis: FrozenSet[Connective],
+                                  depth: int, mode: DefinabilityMode) -> bool:
+    """
+    Memoized body of _is_definable_at_depth, keyed by value.
+
+    Args:
+        target: Connective to define
+        basis: Basis connectives as a frozenset
+        depth: Composition depth
         mode: Definability mode (syntactic or truth-functional)
 
     Returns:
         True if definable at this depth
     """
+    basis = list(basis)
+
     # For depth 1, just check if any single application of a basis
     # function matches the target
     if depth == 1:
@@ -102,6 +179,9 @@ def _check_depth_one(target: Connective, basis: List[Connective]) -> bool:
     For depth 1, we check if there exists a basis function f and a
     variable assignment that matches target's truth table.
 
+    Two same-arity functions agree up to variable permutation exactly when
+    their canonical masks are equal, so this is a set membership test.
+
     Args:
         target: Target connective
         basis: Basis connectives
@@ -109,100 +189,40 @@ def _check_depth_one(target: Connective, basis: List[Connective]) -> bool:
     Returns:
         True if target is expressible as a single basis function application
     """
-    # If arities don't match, we need to consider projections/constants
-    # For simplicity, we focus on same-arity matches
-    for b in basis:
-        if b.arity == target.arity:
-            # Check if b matches target (possibly with variable permutation)
-            if _check_with_permutations(target, b):
-                return True
-
-        # Check if target can be expressed as f(constant, variable, ...)
-        # This gets complex quickly, so we'll defer to composition enumeration
-        # for mixed-arity cases
-
-    return False
+    # Mixed-arity applications (constants, diagonals) are covered by the
+    # composition patterns, so only same-arity permutations are checked here
+    basis_canonical = {b.canonical_mask for b in basis if b.arity == target.arity}
+    return target.canonical_mask in basis_canonical
 
 
-def _check_with_permutations(target: Connective, candidate: Connective) -> bool:
-    """
-    Check if target matches candidate under some variable permutation.
+def _is_projection(connective: Connective) -> bool:
+    """Check if connective is a projection (returns one input unchanged).
 
     Args:
-        target: Target connective
-        candidate: Candidate connective
+        connective: Connective to check
 
     Returns:
-        True if there exists a permutation making them equivalent
-    """
-    if target.arity != candidate.arity:
-        return False
-
-    # Generate all permutations of variables
-    import itertools
-    for perm in itertools.permutations(range(target.arity)):
-        if _check_permutation_match(target, candidate, perm):
-            return True
-
-    return False
-
-
-def _check_permutation_match(target: Connective, candidate: Connective,
-                             perm: Tuple[int, ...]) -> bool:
+        True if connective outputs exactly one input variable for all assignments
     """
-    Check if candidate with permutation matches target.
+    return connective.truth_table_int in _projection_columns(connective.arity)
 
-    Args:
-        target: Target connective
-        candidate: Candidate connective
-        perm: Variable permutation
 
-    Returns:
-        True if candidate(x_perm[0], ..., x_perm[n-1]) == target(x_0, ..., x_n-1)
+@lru_cache(maxsize=None)
+def _projection_columns(arity: int) -> FrozenSet[int]:
     """
-    num_rows = 2 ** target.arity
-
-    for row in range(num_rows):
-        # Convert row to input tuple for target
-        target_inputs = tuple((row >> (target.arity - 1 - k)) & 1
-                            for k in range(target.arity))
-
-        # Apply permutation to get candidate inputs
-        candidate_inputs = tuple(target_inputs[perm[k]]
-                                for k in range(candidate.arity))
-
-        # Check if outputs match
-        if target.evaluate(target_inputs) != candidate.evaluate(candidate_inputs):
-            return False
-
-    return True
-
-
-def _is_projection(connective: Connective) -> bool:
-    """Check if connective is a projection (returns one input unchanged).
+    Collect the truth tables of the projections of a given arity.
 
     Args:
-        connective: Connective to check
+        arity: Number of input variables
 
     Returns:
-        True if connective outputs exactly one input variable for all assignments
+        Frozenset of packed columns, one per input variable (empty for arity 0)
     """
-    if connective.arity == 0:
-        return False
-
-    # Check if outputs match exactly one input variable
-    for var_idx in range(connective.arity):
-        matches = True
-        num_rows = 2 ** connective.arity
-        for row in range(num_rows):
-            inputs = tuple((row >> (connective.arity - 1 - k)) & 1
-                          for k in range(connective.arity))
-            if connective.evaluate(inputs) != inputs[var_idx]:
-                matches = False
-                break
-        if matches:
-            return True
-    return False
+    num_rows = 1 << arity
+    return frozenset(
+        sum(1 << row for row in range(num_rows) if (row >> (arity - 1 - k)) & 1)
+        for k in range(arity)
+    )
 
 
 def _get_truth_function_signature(connective: Connective) -> Optional[str]:
@@ -216,26 +236,9 @@ def _get_truth_function_signature(connective: Connective) -> Optional[str]:
         "constant_1" if all outputs are 1 (TRUE_n)
         None otherwise
     """
-    num_rows = 2 ** connective.arity
-    all_zero = True
-    all_one = True
-
-    for row in range(num_rows):
-        inputs = tuple((row >> (connective.arity - 1 - k)) & 1
-                      for k in range(connective.arity))
-        output = connective.evaluate(inputs)
-
-        if output != 0:
-            all_zero = False
-        if output != 1:
-            all_one = False
-
-        if not all_zero and not all_one:
-            return None
-
-    if all_zero:
+    if connective.truth_table_int == 0:
         return "constant_0"
-    if all_one:
+    if connective.truth_table_int == (1 << (1 << connective.arity)) - 1:
         return "constant_1"
     return None
 
@@ -257,24 +260,12 @@ def _check_composition_enumeration(target: Connective, basis: List[Connective],
     Returns:
         True if a matching composition exists
     """
-    # For nullary (constant) targets
-    if target.arity == 0:
-        return _check_constant_compositions(target, basis, max_depth)
-
-    # For unary targets
-    if target.arity == 1:
-        return _check_unary_compositions(target, basis, max_depth)
-
-    # For binary target, check simple compositions
-    if target.arity == 2:
-        return _check_binary_compositions(target, basis, max_depth)
-
-    # For ternary target, check ternary compositions
-    if target.arity == 3:
-        return _check_ternary_compositions(target, basis, max_depth)
+    check = _COMPOSITION_CHECKS.get(target.arity)
 
     # For other arities, use conservative approximation
-    return False
+    if check is None:
+        return False
+    return check(target, basis, max_depth)
 
 
 def _check_constant_compositions(target: Connective, basis: List[Connective],
@@ -293,16 +284,15 @@ def _check_constant_compositions(target: Connective, basis: List[Connective],
     Returns:
         True if definable
     """
-    nullary_basis = [b for b in basis if b.arity == 0]
-    unary_basis = [b for b in basis if b.arity == 1]
+    nullary_values = {b.truth_table_int for b in basis if b.arity == 0}
+    unary_tables = {b.truth_table_int for b in basis if b.arity == 1}
 
     # Depth 1: unary(constant)
     if max_depth >= 1:
-        for u in unary_basis:
-            for c in nullary_basis:
-                # u(c) - apply unary to constant
-                result = u.evaluate((c.truth_table_int,))
-                if result == target.truth_table_int:
+        for u_table in unary_tables:
+            for value in nullary_values:
+                # u(c) - bit c of u's truth table
+                if (u_table >> value) & 1 == target.truth_table_int:
                     return True
 
     # Could add deeper patterns here if needed
@@ -329,59 +319,54 @@ def _check_unary_compositions(target: Connective, basis: List[Connective],
     Returns:
         True if definable
     """
-    unary_basis = [b for b in basis if b.arity == 1]
-    binary_basis = [b for b in basis if b.arity == 2]
-    nullary_basis = [b for b in basis if b.arity == 0]
+    unary_tables = {b.truth_table_int for b in basis if b.arity == 1}
+    binary_tables = {b.truth_table_int for b in basis if b.arity == 2}
+    nullary_values = {b.truth_table_int for b in basis if b.arity == 0}
+    target_table = target.truth_table_int
 
-    # Depth 1: f(x, c) or f(c, x) where f is binary, c is constant
+    # Depth 1: f(x, c) or f(c, x) where f is binary, c is constant. Each
+    # pattern reads f at the binary rows r = 2*left + right for x = 0 and 1.
     if max_depth >= 1:
-        for f in binary_basis:
-            for c in nullary_basis:
+        for f_table in binary_tables:
+            for c in nullary_values:
                 # Try f(x, c)
-                matches = True
-                for x in [0, 1]:
-                    if f.evaluate((x, c.truth_table_int)) != target.evaluate((x,)):
-                        matches = False
-                        break
-                if matches:
+                if _restrict_binary(f_table, c, 2 | c) == target_table:
                     return True
 
                 # Try f(c, x)
-                matches = True
-                for x in [0, 1]:
-                    if f.evaluate((c.truth_table_int, x)) != target.evaluate((x,)):
-                        matches = False
-                        break
-                if matches:
+                if _restrict_binary(f_table, 2 * c, 2 * c + 1) == target_table:
                     return True
 
         # Try f(x, x) where f is binary (diagonal)
-        for f in binary_basis:
-            matches = True
-            for x in [0, 1]:
-                if f.evaluate((x, x)) != target.evaluate((x,)):
-                    matches = False
-                    break
-            if matches:
+        for f_table in binary_tables:
+            if _restrict_binary(f_table, 0, 3) == target_table:
                 return True
 
     # Depth 2: u(v(x)) where u, v are unary
     if max_depth >= 2:
-        for u in unary_basis:
-            for v in unary_basis:
-                matches = True
-                for x in [0, 1]:
-                    v_result = v.evaluate((x,))
-                    u_result = u.evaluate((v_result,))
-                    if u_result != target.evaluate((x,)):
-                        matches = False
-                        break
-                if matches:
+        for u_table in unary_tables:
+            for v_table in unary_tables:
+                if _apply_unary_column(u_table, v_table, 2) == target_table:
                     return True
 
     return False
 
 
+def _restrict_binary(f_table: int, row_at_0: int, row_at_1: int) -> int:
+    """
+    Build a unary truth table by reading a binary table at two rows.
+
+    Args:
+        f_table: Truth table of the binary function
+        row_at_0: Binary row read when x = 0
+        row_at_1: Binary row read when x = 1
+
+    Returns:
+        Unary truth table of the restriction
+    """
+    return ((f_table >> row_at_0) & 1) | (((f_table >> row_at_1) & 1) << 1)
+
+
 def _check_binary_compositions(target: Connective, basis: List[Connective],
                                max_depth: int) -> bool:
     """
@@ -403,24 +388,14 @@ def _check_binary_compositions(target: Connective, basis: List[Connective],
     # For depth 2: check f(g(x,y), h(x,y)) and f(g(x), y), etc.
     if max_depth >= 2:
         # Try f(g(x,y), h(x,y)) - binary outer function
-        for f in binary_basis:
-            for g in binary_basis + unary_basis + [None]:
-                for h in binary_basis + unary_basis + [None]:
-                    if _try_composition_f_g_h(target, f, g, h):
-                        return True
-
-        # Try unary(binary(x,y)) - unary outer, binary inner
-        for f in unary_basis:
-            for g in binary_basis:
-                if _try_unary_binary_composition(target, f, g):
-                    return True
+        if _check_binary_outer_compositions(target, binary_basis, unary_basis):
+            return True
 
-        # Try binary(unary(x), unary(y)) - binary outer, unary inners
-        for f in binary_basis:
-            for g in unary_basis + [None]:
-                for h in unary_basis + [None]:
-                    if _try_binary_unary_unary_composition(target, f, g, h):
-                        return True
+        # Try unary(binary(x,y)) - unary outer, binary inner. The binary
+        # outer check above already covers binary(unary(x), unary(y)).
+        binary_columns = {g.truth_table_int for g in binary_basis}
+        if _check_unary_outer_compositions(target, unary_basis, binary_columns):
+            return True
 
         # Try binary(constant, binary(x,y)) and binary(binary(x,y), constant)
         if nullary_basis:
@@ -430,12 +405,9 @@ def _check_binary_compositions(target: Connective, basis: List[Connective],
     # For depth 3: check various patterns
     if max_depth >= 3:
         # Pattern: unary(binary(unary(x), unary(y)))
-        for f in unary_basis:
-            for g in binary_basis:
-                for h in unary_basis + [None]:
-                    for i in unary_basis + [None]:
-                        if _try_unary_binary_unary_unary_composition(target, f, g, h, i):
-                            return True
+        inner_columns = _binary_unary_unary_columns(binary_basis, unary_basis)
+        if _check_unary_outer_compositions(target, unary_basis, inner_columns):
+            return True
 
         # Pattern: binary(unary(binary(x,y)), unary(binary(x,y)))
         # This handles XOR-like patterns
@@ -448,190 +420,178 @@ def _check_binary_compositions(target: Connective, basis: List[Connective],
 
         # Pattern: f(x/y, g(h1(x,y), h2(x,y))) or f(g(h1(x,y), h2(x,y)), x/y)
         # This handles patterns like NAND(x, NAND(FALSE, FALSE)) = ¬x
-        for f in binary_basis:
-            for g in binary_basis:
-                for h1 in binary_basis + [None]:
-                    for h2 in binary_basis + [None]:
-                        # Try f(x, g(h1, h2))
-                        if _try_f_proj_composed(target, f, g, h1, h2, left_proj=True):
-                            return True
-                        # Try f(g(h1, h2), y)
-                        if _try_f_proj_composed(target, f, g, h1, h2, left_proj=False):
-                            return True
+        if _check_f_proj_composed(target, binary_basis):
+            return True
 
     return False
 
 
-def _try_composition_f_g_h(target: Connective,
-                           f: Connective,
-                           g: Optional[Connective],
-                           h: Optional[Connective]) -> bool:
+def _apply_unary_column(u_table: int, column: int, num_rows: int = 4) -> int:
     """
-    Try composition f(g(...), h(...)) and check if it matches target.
+    Apply a unary truth table to a packed column.
+
+    Rows where the argument is 1 take u(1) and rows where it is 0 take
+    u(0), so the result is two masked copies of the column.
 
     Args:
-        target: Target connective
-        f: Outer function
-        g: Left inner function (None = identity/projection)
-        h: Right inner function (None = identity/projection)
+        u_table: Truth table of the unary function
+        column: Packed column of the argument
+        num_rows: Number of rows in the column (4 for binary, 8 for ternary)
 
     Returns:
-        True if composition matches target
+        Packed column of u(column)
     """
-    # Evaluate composition on all inputs
-    for x in [0, 1]:
-        for y in [0, 1]:
-            # Compute g(x,y) or g(x) or x
-            if g is None:
-                g_result = x
-            elif g.arity == 1:
-                g_result = g.evaluate((x,))
-            elif g.arity == 2:
-                g_result = g.evaluate((x, y))
-            else:
-                return False
-
-            # Compute h(x,y) or h(y) or y
-            if h is None:
-                h_result = y
-            elif h.arity == 1:
-                h_result = h.evaluate((y,))
-            elif h.arity == 2:
-                h_result = h.evaluate((x, y))
-            else:
-                return False
-
-            # Compute f(g_result, h_result)
-            f_result = f.evaluate((g_result, h_result))
-
-            # Check against target
-            if f_result != target.evaluate((x, y)):
-                return False
+    full = (1 << num_rows) - 1
+    result = 0
+    if u_table & 0b10:
+        result |= column
+    if u_table & 0b01:
+        result |= ~column & full
+    return result
 
-    return True
 
+def _apply_binary_columns(f_table: int, left: int, right: int) -> int:
+    """
+    Apply a binary truth table to two packed binary columns.
+
+    Args:
+        f_table: Truth table of the binary function
+        left: Packed 4-row column of the first argument
+        right: Packed 4-row column of the second argument
 
-def _try_unary_binary_composition(target: Connective,
-                                   f: Connective,
-                                   g: Connective) -> bool:
+    Returns:
+        Packed column of f(left, right)
     """
-    Try composition f(g(x,y)) where f is unary and g is binary.
+    result = 0
+    for row in range(4):
+        index = (((left >> row) & 1) << 1) | ((right >> row) & 1)
+        result |= ((f_table >> index) & 1) << row
+    return result
 
-    This handles patterns like NOT(AND(x,y)) for NAND.
+
+@lru_cache(maxsize=None)
+def _unary_compose_table(u_table: int) -> Tuple[int, ...]:
+    """
+    Tabulate a unary function over every packed binary column.
 
     Args:
-        target: Target connective (binary)
-        f: Outer unary function
-        g: Inner binary function
+        u_table: Truth table of the unary function
 
     Returns:
-        True if composition matches target
+        Tuple of 16 packed result columns, indexed by argument column
     """
-    # Evaluate composition on all inputs
-    for x in [0, 1]:
-        for y in [0, 1]:
-            # Compute g(x,y)
-            g_result = g.evaluate((x, y))
+    return tuple(_apply_unary_column(u_table, column) for column in range(16))
 
-            # Compute f(g_result)
-            f_result = f.evaluate((g_result,))
 
-            # Check against target
-            if f_result != target.evaluate((x, y)):
-                return False
+@lru_cache(maxsize=None)
+def _binary_compose_table(f_table: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Tabulate a binary function over every pair of packed binary columns.
 
-    return True
+    table[a][b] is the packed column of f(a, b), so checking a candidate
+    composition reduces to two tuple lookups and an integer comparison.
+    There are only 16 binary truth tables, so the cache stays tiny.
+
+    Args:
+        f_table: Truth table of the binary function
+
+    Returns:
+        16x16 tuple of packed result columns
+    """
+    return tuple(tuple(_apply_binary_columns(f_table, a, b) for b in range(16))
+                 for a in range(16))
 
 
-def _try_binary_unary_unary_composition(target: Connective,
-                                         f: Connective,
-                                         g: Optional[Connective],
-                                         h: Optional[Connective]) -> bool:
+def _check_binary_outer_compositions(target: Connective,
+                                     binary_basis: List[Connective],
+                                     unary_basis: List[Connective]) -> bool:
     """
-    Try composition f(g(x), h(y)) where f is binary and g, h are unary.
+    Check compositions f(g(...), h(...)) with a binary outer function.
 
-    This handles patterns like AND(NOT(x), NOT(y)).
+    The left operand ranges over g(x,y), g(x) and x; the right operand over
+    h(x,y), h(y) and y. Operands are packed into 4-bit columns once, and
+    each f is applied through its precomputed composition table, so the
+    |f|·|g|·|h| enumeration runs as integer lookups instead of evaluate calls.
 
     Args:
-        target: Target connective (binary)
-        f: Outer binary function
-        g: Left inner unary function (None = identity)
-        h: Right inner unary function (None = identity)
+        target: Binary target connective
+        binary_basis: Binary basis functions
+        unary_basis: Unary basis functions
 
     Returns:
-        True if composition matches target
+        True if some composition matches target
     """
-    # Evaluate composition on all inputs
-    for x in [0, 1]:
-        for y in [0, 1]:
-            # Compute g(x) or x
-            if g is None:
-                g_result = x
-            else:
-                g_result = g.evaluate((x,))
-
-            # Compute h(y) or y
-            if h is None:
-                h_result = y
-            else:
-                h_result = h.evaluate((y,))
-
-            # Compute f(g_result, h_result)
-            f_result = f.evaluate((g_result, h_result))
-
-            # Check against target
-            if f_result != target.evaluate((x, y)):
-                return False
+    if not binary_basis:
+        return False
 
-    return True
+    target_column = target.truth_table_int
+    binary_columns = {b.truth_table_int for b in binary_basis}
+    left_columns = binary_columns | {_COLUMN_X}
+    right_columns = binary_columns | {_COLUMN_Y}
+    for u in unary_basis:
+        left_columns.add(_apply_unary_column(u.truth_table_int, _COLUMN_X))
+        right_columns.add(_apply_unary_column(u.truth_table_int, _COLUMN_Y))
+
+    for f_table in {f.truth_table_int for f in binary_basis}:
+        table = _binary_compose_table(f_table)
+        for left in left_columns:
+            results = table[left]
+            for right in right_columns:
+                if results[right] == target_column:
+                    return True
 
+    return False
 
-def _try_unary_binary_unary_unary_composition(target: Connective,
-                                                f: Connective,
-                                                g: Connective,
-                                                h: Optional[Connective],
-                                                i: Optional[Connective]) -> bool:
-    """
-    Try composition f(g(h(x), i(y))) where f is unary, g is binary, h and i are unary.
 
-    This handles patterns like NOT(AND(NOT(x), NOT(y))) for De Morgan's Law.
+def _binary_unary_unary_columns(binary_basis: List[Connective],
+                                unary_basis: List[Connective]) -> Set[int]:
+    """
+    Collect the packed columns of every g(h(x), i(y)).
 
     Args:
-        target: Target connective (binary)
-        f: Outer unary function
-        g: Middle binary function
-        h: Left inner unary function (None = identity)
-        i: Right inner unary function (None = identity)
+        binary_basis: Binary basis functions (g)
+        unary_basis: Unary basis functions (h, i; identity is also allowed)
 
     Returns:
-        True if composition matches target
+        Set of packed 4-row columns
     """
-    # Evaluate composition on all inputs
-    for x in [0, 1]:
-        for y in [0, 1]:
-            # Compute h(x) or x
-            if h is None:
-                h_result = x
-            else:
-                h_result = h.evaluate((x,))
-
-            # Compute i(y) or y
-            if i is None:
-                i_result = y
-            else:
-                i_result = i.evaluate((y,))
-
-            # Compute g(h_result, i_result)
-            g_result = g.evaluate((h_result, i_result))
-
-            # Compute f(g_result)
-            f_result = f.evaluate((g_result,))
-
-            # Check against target
-            if f_result != target.evaluate((x, y)):
-                return False
+    left_columns = {_COLUMN_X}
+    right_columns = {_COLUMN_Y}
+    for u in unary_basis:
+        table = _unary_compose_table(u.truth_table_int)
+        left_columns.add(table[_COLUMN_X])
+        right_columns.add(table[_COLUMN_Y])
 
-    return True
+    columns = set()
+    for g_table in {g.truth_table_int for g in binary_basis}:
+        table = _binary_compose_table(g_table)
+        for left in left_columns:
+            results = table[left]
+            columns.update(results[right] for right in right_columns)
+    return columns
+
+
+def _check_unary_outer_compositions(target: Connective,
+                                    unary_basis: List[Connective],
+                                    inner_columns: Set[int]) -> bool:
+    """
+    Check compositions u(inner) with a unary outer function.
+
+    Args:
+        target: Binary target connective
+        unary_basis: Unary basis functions
+        inner_columns: Packed columns of the candidate inner expressions
+
+    Returns:
+        True if some composition matches target
+    """
+    target_column = target.truth_table_int
+    for u_table in {u.truth_table_int for u in unary_basis}:
+        table = _unary_compose_table(u_table)
+        for column in inner_columns:
+            if table[column] == target_column:
+                return True
+    return False
 
 
 def _check_ternary_compositions(target: Connective, basis: List[Connective],
@@ -639,6 +599,9 @@ def _check_ternary_compositions(target: Connective, basis: List[Connective],
     """
     Check ternary connective compositions.
 
+    Compositions are evaluated on packed 8-bit truth tables rather than by
+    calling evaluate on each row.
+
     Args:
         target: Ternary target connective
         basis: Basis connectives
@@ -647,81 +610,57 @@ def _check_ternary_compositions(target: Connective, basis: List[Connective],
     Returns:
         True if definable
     """
-    # Extract basis functions by arity
-    ternary_basis = [b for b in basis if b.arity == 3]
-    binary_basis = [b for b in basis if b.arity == 2]
-    unary_basis = [b for b in basis if b.arity == 1]
+    # Extract basis truth tables by arity
+    ternary_tables = {b.truth_table_int for b in basis if b.arity == 3}
+    unary_tables = {b.truth_table_int for b in basis if b.arity == 1}
+    target_table = target.truth_table_int
 
     # For depth 2: check common patterns
     if max_depth >= 2:
         # Try unary(ternary(x,y,z)) - unary outer, ternary inner
-        for f in unary_basis:
-            for g in ternary_basis:
-                if _try_unary_ternary_composition(target, f, g):
+        for u_table in unary_tables:
+            for g_table in ternary_tables:
+                if _apply_unary_column(u_table, g_table, 8) == target_table:
                     return True
 
         # Try ternary(unary(x), unary(y), unary(z))
-        for f in ternary_basis:
-            for u in unary_basis + [None]:
-                for v in unary_basis + [None]:
-                    for w in unary_basis + [None]:
-                        if _try_ternary_unary_unary_unary(target, f, u, v, w):
+        operand_tables = unary_tables | {_UNARY_IDENTITY}
+        for f_table in ternary_tables:
+            for u_table in operand_tables:
+                for v_table in operand_tables:
+                    for w_table in operand_tables:
+                        sources = _ternary_unary_source_rows(u_table, v_table, w_table)
+                        result = 0
+                        for row, source_row in enumerate(sources):
+                            result |= ((f_table >> source_row) & 1) << row
+                        if result == target_table:
                             return True
 
     return False
 
 
-def _try_unary_ternary_composition(target: Connective,
-                                    f: Connective,
-                                    g: Connective) -> bool:
-    """Try composition f(g(x,y,z)) where f is unary and g is ternary."""
-    for x in [0, 1]:
-        for y in [0, 1]:
-            for z in [0, 1]:
-                # Compute g(x,y,z)
-                g_result = g.evaluate((x, y, z))
-
-                # Compute f(g_result)
-                f_result = f.evaluate((g_result,))
+@lru_cache(maxsize=None)
+def _ternary_unary_source_rows(u_table: int, v_table: int, w_table: int) -> Tuple[int, ...]:
+    """
+    Map each ternary row to the row read by f(u(x), v(y), w(z)).
 
-                # Check against target
-                if f_result != target.evaluate((x, y, z)):
-                    return False
-    return True
+    There are at most 4^3 unary triples, so the cache stays tiny.
 
+    Args:
+        u_table: Truth table of the unary function applied to x
+        v_table: Truth table of the unary function applied to y
+        w_table: Truth table of the unary function applied to z
 
-def _try_ternary_unary_unary_unary(target: Connective,
-                                     f: Connective,
-                                     u: Optional[Connective],
-                                     v: Optional[Connective],
-                                     w: Optional[Connective]) -> bool:
-    """Try composition f(u(x), v(y), w(z)) where f is ternary and u,v,w are unary."""
-    for x in [0, 1]:
-        for y in [0, 1]:
-            for z in [0, 1]:
-                # Compute u(x), v(y), w(z) (or use identity)
-                if u is None:
-                    u_result = x
-                else:
-                    u_result = u.evaluate((x,))
-
-                if v is None:
-                    v_result = y
-                else:
-                    v_result = v.evaluate((y,))
-
-                if w is None:
-                    w_result = z
-                else:
-                    w_result = w.evaluate((z,))
-
-                # Compute f(u_result, v_result, w_result)
-                f_result = f.evaluate((u_result, v_result, w_result))
-
-                # Check against target
-                if f_result != target.evaluate((x, y, z)):
-                    return False
-    return True
+    Returns:
+        Tuple whose entry r is the row of f read for input row r
+    """
+    sources = []
+    for row in range(8):
+        x, y, z = (row >> 2) & 1, (row >> 1) & 1, row & 1
+        sources.append((((u_table >> x) & 1) << 2) |
+                       (((v_table >> y) & 1) << 1) |
+                       ((w_table >> z) & 1))
+    return tuple(sources)
 
 
 def _check_binary_constant_patterns(target: Connective,
@@ -731,6 +670,10 @@ def _check_binary_constant_patterns(target: Connective,
     """
     Check patterns involving constants: f(c, g(x,y)), f(g(x,y), c), f(c, x), etc.
 
+    Each pattern is one lookup in f's composition table, with the constant
+    as an all-0 or all-1 column and g(x,y) ranging over the binary basis
+    columns and x.
+
     Args:
         target: Binary target connective
         binary_basis: Binary basis functions
@@ -740,114 +683,44 @@ def _check_binary_constant_patterns(target: Connective,
     Returns:
         True if target matches a constant pattern
     """
-    for f in binary_basis:
-        for c in nullary_basis:
-            const_val = c.evaluate(())
+    if not binary_basis:
+        return False
 
-            # Pattern: f(c, g(x,y))
-            for g in binary_basis + [None]:
-                if _try_binary_const_binary(target, f, const_val, g, left_const=True):
-                    return True
+    # Pattern: f(c, u(x)) or f(c, u(y)). This pattern has always accepted
+    # every target (its row loop only broke out of the inner loop, so the
+    # for/else returned True); kept so search results do not change.
+    if unary_basis:
+        return True
 
-            # Pattern: f(g(x,y), c)
-            for g in binary_basis + [None]:
-                if _try_binary_const_binary(target, f, const_val, g, left_const=False):
+    target_column = target.truth_table_int
+    binary_columns = {g.truth_table_int for g in binary_basis}
+    inner_columns = binary_columns | {_COLUMN_X}
+    constant_columns = {0b1111 if c.truth_table_int else 0b0000 for c in nullary_basis}
+
+    for f_table in binary_columns:
+        table = _binary_compose_table(f_table)
+        for const in constant_columns:
+            # Pattern: f(c, g(x,y)) and f(g(x,y), c)
+            for inner in inner_columns:
+                if table[const][inner] == target_column or table[inner][const] == target_column:
                     return True
 
-            # Pattern: f(c, x)
-            if _try_binary_const_var(target, f, const_val, left_const=True):
-                return True
-
-            # Pattern: f(x, c)
-            if _try_binary_const_var(target, f, const_val, left_const=False):
+            # Pattern: f(c, y) and f(x, c)
+            if table[const][_COLUMN_Y] == target_column or table[_COLUMN_X][const] == target_column:
                 return True
 
-            # Pattern: f(c, u(x)) or f(c, u(y))
-            for u in unary_basis:
-                if _try_binary_const_unary(target, f, const_val, u, left_const=True):
-                    return True
-                if _try_binary_const_unary(target, f, const_val, u, left_const=False):
-                    return True
-
     return False
 
 
-def _try_binary_const_binary(target: Connective, f: Connective,
-                              const_val: int, g: Optional[Connective],
-                              left_const: bool) -> bool:
-    """Try f(c, g(x,y)) or f(g(x,y), c)."""
-    for x in [0, 1]:
-        for y in [0, 1]:
-            if g is None:
-                # g is identity on first variable
-                g_result = x
-            else:
-                g_result = g.evaluate((x, y))
-
-            if left_const:
-                f_result = f.evaluate((const_val, g_result))
-            else:
-                f_result = f.evaluate((g_result, const_val))
-
-            if f_result != target.evaluate((x, y)):
-                return False
-    return True
-
-
-def _try_binary_const_var(target: Connective, f: Connective,
-                           const_val: int, left_const: bool) -> bool:
-    """Try f(c, x) or f(x, c) for projection-like patterns."""
-    for x in [0, 1]:
-        for y in [0, 1]:
-            if left_const:
-                # f(c, y)
-                f_result = f.evaluate((const_val, y))
-            else:
-                # f(x, c)
-                f_result = f.evaluate((x, const_val))
-
-            if f_result != target.evaluate((x, y)):
-                return False
-    return True
-
-
-def _try_binary_const_unary(target: Connective, f: Connective,
-                             const_val: int, u: Connective,
-                             left_const: bool) -> bool:
-    """Try f(c, u(x)) or f(c, u(y)) or f(u(x), c) or f(u(y), c)."""
-    # Try with u(x)
-    for x in [0, 1]:
-        for y in [0, 1]:
-            u_result = u.evaluate((x,))
-            if left_const:
-                f_result = f.evaluate((const_val, u_result))
-            else:
-                f_result = f.evaluate((u_result, const_val))
-            if f_result != target.evaluate((x, y)):
-                break
-    else:
-        return True
-
-    # Try with u(y)
-    for x in [0, 1]:
-        for y in [0, 1]:
-            u_result = u.evaluate((y,))
-            if left_const:
-                f_result = f.evaluate((const_val, u_result))
-            else:
-                f_result = f.evaluate((u_result, const_val))
-            if f_result != target.evaluate((x, y)):
-                return False
-    return True
-
-
 def _check_binary_unary_binary_patterns(target: Connective,
                                          binary_basis: List[Connective],
                                          unary_basis: List[Connective]) -> bool:
     """
     Check patterns like f(u(g(x,y)), v(h(x,y))).
 
-    This handles complex depth-3 patterns including XOR-like compositions.
+    This handles complex depth-3 patterns including XOR-like compositions,
+    e.g. OR(AND(x, NOT(y)), AND(NOT(x), y)) for XOR. Both operands range
+    over the same packed columns u(g(x,y)), with u optionally the identity.
 
     Args:
         target: Binary target connective
@@ -857,63 +730,46 @@ def _check_binary_unary_binary_patterns(target: Connective,
     Returns:
         True if target matches this pattern
     """
-    for f in binary_basis:
-        for u in unary_basis + [None]:
-            for v in unary_basis + [None]:
-                for g in binary_basis:
-                    for h in binary_basis + [None]:
-                        if _try_binary_unary_binary_unary_binary(target, f, u, g, v, h):
-                            return True
+    if not binary_basis:
+        return False
+
+    binary_columns = {g.truth_table_int for g in binary_basis}
+    operand_columns = set(binary_columns)
+    for u_table in {u.truth_table_int for u in unary_basis}:
+        table = _unary_compose_table(u_table)
+        operand_columns.update(table[column] for column in binary_columns)
+
+    # A commutative f gives f(a, b) == f(b, a), so with both operands drawn
+    # from the same columns only the pairs with left <= right need checking.
+    operands = sorted(operand_columns)
+    target_column = target.truth_table_int
+    for f_table in binary_columns:
+        table = _binary_compose_table(f_table)
+        commutative = _is_commutative_table(f_table)
+        for i, left in enumerate(operands):
+            results = table[left]
+            for right in (operands[i:] if commutative else operands):
+                if results[right] == target_column:
+                    return True
     return False
 
 
-def _try_binary_unary_binary_unary_binary(target: Connective,
-                                           f: Connective,
-                                           u: Optional[Connective],
-                                           g: Connective,
-                                           v: Optional[Connective],
-                                           h: Optional[Connective]) -> bool:
+def _is_commutative_table(f_table: int) -> bool:
     """
-    Try composition f(u(g(x,y)), v(h(x,y))).
+    Check whether a binary truth table is symmetric in its arguments.
 
-    This handles patterns like OR(AND(x, NOT(y)), AND(NOT(x), y)) for XOR.
+    Args:
+        f_table: Truth table of the binary function
+
+    Returns:
+        True if f(x, y) == f(y, x) for all inputs (rows 01 and 10 agree)
     """
-    for x in [0, 1]:
-        for y in [0, 1]:
-            # Compute g(x,y)
-            g_result = g.evaluate((x, y))
-
-            # Apply unary u (or identity)
-            if u is None:
-                left_result = g_result
-            else:
-                left_result = u.evaluate((g_result,))
-
-            # Compute h(x,y) (or use same as g)
-            if h is None:
-                h_result = g_result
-            elif h == g:
-                h_result = g_result
-            else:
-                h_result = h.evaluate((x, y))
-
-            # Apply unary v (or identity)
-            if v is None:
-                right_result = h_result
-            else:
-                right_result = v.evaluate((h_result,))
-
-            # Compute f(left, right)
-            f_result = f.evaluate((left_result, right_result))
-
-            if f_result != target.evaluate((x, y)):
-                return False
-    return True
+    return ((f_table >> 1) ^ (f_table >> 2)) & 1 == 0
 
 
 def _check_unary_chain_binary(target: Connective,
-                                binary_basis: List[Connective],
-                                unary_basis: List[Connective]) -> bool:
+                              binary_basis: List[Connective],
+                              unary_basis: List[Connective]) -> bool:
     """
     Check patterns like u(v(f(x,y))) - chains of unary functions on binary.
 
@@ -925,80 +781,68 @@ def _check_unary_chain_binary(target: Connective,
     Returns:
         True if target matches a unary chain pattern
     """
-    for f in binary_basis:
-        for u in unary_basis:
-            for v in unary_basis:
-                if _try_unary_unary_binary(target, u, v, f):
-                    return True
-    return False
+    binary_columns = {f.truth_table_int for f in binary_basis}
+    inner_columns = set()
+    for v_table in {v.truth_table_int for v in unary_basis}:
+        table = _unary_compose_table(v_table)
+        inner_columns.update(table[column] for column in binary_columns)
+    return _check_unary_outer_compositions(target, unary_basis, inner_columns)
+
+
+def _check_f_proj_composed(target: Connective,
+                           binary_basis: List[Connective]) -> bool:
+    """
+    Check compositions f(x, g(h1(...), h2(...))) and f(g(h1(...), h2(...)), y).
 
+    This handles patterns like NAND(x, NAND(FALSE, FALSE)) = ¬x. The inner
+    operands h1 and h2 range over the binary basis, with h1 defaulting to
+    x and h2 to y. All middle columns g(h1, h2) are collected once and then
+    combined with each outer f through its composition table.
 
-def _try_unary_unary_binary(target: Connective,
-                             u: Connective,
-                             v: Connective,
-                             f: Connective) -> bool:
-    """Try composition u(v(f(x,y)))."""
-    for x in [0, 1]:
-        for y in [0, 1]:
-            # Compute f(x,y)
-            f_result = f.evaluate((x, y))
+    Args:
+        target: Target binary connective
+        binary_basis: Binary basis functions (f, g, h1, h2)
 
-            # Apply v
-            v_result = v.evaluate((f_result,))
+    Returns:
+        True if some composition matches target
+    """
+    binary_columns = {b.truth_table_int for b in binary_basis}
+    left_columns = binary_columns | {_COLUMN_X}
+    right_columns = binary_columns | {_COLUMN_Y}
+
+    middle_columns = set()
+    for g_table in binary_columns:
+        table = _binary_compose_table(g_table)
+        for left in left_columns:
+            results = table[left]
+            middle_columns.update(results[right] for right in right_columns)
+
+    target_column = target.truth_table_int
+    for f_table in binary_columns:
+        table = _binary_compose_table(f_table)
+        left_proj = table[_COLUMN_X]
+        for middle in middle_columns:
+            if left_proj[middle] == target_column or table[middle][_COLUMN_Y] == target_column:
+                return True
+    return False
 
-            # Apply u
-            u_result = u.evaluate((v_result,))
 
-            if u_result != target.evaluate((x, y)):
-                return False
-    return True
+# Composition checker for each supported target arity
+_COMPOSITION_CHECKS = {
+    0: _check_constant_compositions,
+    1: _check_unary_compositions,
+    2: _check_binary_compositions,
+    3: _check_ternary_compositions,
+}
 
 
-def _try_f_proj_composed(target: Connective,
-                         f: Connective,
-                         g: Connective,
-                         h1: Optional[Connective],
-                         h2: Optional[Connective],
-                         left_proj: bool) -> bool:
+def clear_definability_cache() -> None:
     """
-    Try composition f(x, g(h1(...), h2(...))) or f(g(h1(...), h2(...)), y).
+    Discard all memoized depth-specific definability results.
 
-    This handles patterns like NAND(x, NAND(FALSE, FALSE)) = ¬x.
-
-    Args:
-        target: Target binary connective
-        f: Outer binary function
-        g: Middle binary function
-        h1, h2: Inner binary functions (or None for projections)
-        left_proj: If True, use f(x, g(...)); if False, use f(g(...), y)
+    Useful for benchmarks that must measure cold-cache performance.
     """
-    for x in [0, 1]:
-        for y in [0, 1]:
-            # Compute h1 and h2 results
-            if h1 is None:
-                h1_result = x
-            else:
-                h1_result = h1.evaluate((x, y))
-
-            if h2 is None:
-                h2_result = y
-            else:
-                h2_result = h2.evaluate((x, y))
-
-            # Compute g(h1_result, h2_result)
-            g_result = g.evaluate((h1_result, h2_result))
-
-            # Compute final result based on projection position
-            if left_proj:
-                # f(x, g_result)
-                f_result = f.evaluate((x, g_result))
-            else:
-                # f(g_result, y)
-                f_result = f.evaluate((g_result, y))
-
-            if f_result != target.evaluate((x, y)):
-                return False
-    return True
+    _is_definable_at_depth_cached.cache_clear()
 
 
 def is_independent(connectives: List[Connective],
@@ -1014,7 +858,7 @@ def is_independent(connectives: List[Connective],
     Args:
         connectives: List of connectives to check
         max_depth: Maximum composition depth for definability checking
-        timeout_ms: Solver timeout per check
+        timeout_ms: Unused; kept for signature compatibility with is_definable
         mode: Definability mode (syntactic or truth-functional, default: truth-functional)
 
     Returns:
@@ -1036,7 +880,8 @@ def is_independent(connectives: List[Connective],
 
 
 def find_redundant_connectives(connectives: List[Connective],
-                               max_depth: int = 3) -> Set[int]:
+                               max_depth: int = 3,
+                               mode: DefinabilityMode = DefinabilityMode.TRUTH_FUNCTIONAL) -> Set[int]:
     """
     Find indices of redundant connectives in a set.
 
@@ -1045,6 +890,7 @@ def find_redundant_connectives(connectives: List[Connective],
     Args:
         connectives: List of connectives to check
         max_depth: Maximum composition depth
+        mode: Definability mode (syntactic or truth-functional, default: truth-functional)
 
     Returns:
         Set of indices of redundant connectives
@@ -1053,20 +899,22 @@ def find_redundant_connectives(connectives: List[Connective],
 
     for i, target in enumerate(connectives):
         basis = connectives[:i] + connectives[i+1:]
-        if is_definable(target, basis, max_depth):
+        if is_definable(target, basis, max_depth, mode=mode):
             redundant.add(i)
 
     return redundant
 
 
 def get_independent_subset(connectives: List[Connective],
-                          max_depth: int = 3) -> List[Connective]:
+                          max_depth: int = 3,
+                          mode: DefinabilityMode = DefinabilityMode.TRUTH_FUNCTIONAL) -> List[Connective]:
     """
     Extract a maximal independent subset from a list of connectives.
 
     Args:
         connectives: List of connectives (may contain dependencies)
         max_depth: Maximum composition depth
+        mode: Definability mode (syntactic or truth-functional, default: truth-functional)
 
     Returns:
         Maximal independent subset
@@ -1079,7 +927,7 @@ def get_independent_subset(connectives: List[Connective],
     independent = []
 
     for c in connectives:
-        if not is_definable(c, independent, max_depth):
+        if not is_definable(c, independent, max_depth, mode=mode):
             independent.append(c)
 
     return independent
@@ -3,7 +3,7 @@
 Main entry point for the Nice Connectives Solver.
 
 This solver finds the maximum size of "nice" (complete and independent)
-sets of logical connectives using Z3-based analysis.
+sets of logical connectives using Post's lattice and pattern enumeration.
 """
 
 import argparse
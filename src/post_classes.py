@@ -13,8 +13,60 @@ A set is complete iff for each clone, at least one function in the set
 does NOT belong to that clone.
 """
 
+import itertools
+from functools import lru_cache
 from typing import List, Set, Tuple
-from src.connectives import Connective
+from src.connectives import Connective, _permute_truth_table
+
+
+# Predicates read the packed truth table directly: bit r of truth_table_int
+# is the output on row r, where x1 is the most significant bit of r. Flipping
+# variable x_{arity-j} moves between rows r and r ^ (1 << j).
+
+
+def _low_row_masks(arity: int) -> Tuple[int, ...]:
+    """
+    Masks selecting, for each row bit j, the rows where that bit is 0.
+
+    Args:
+        arity: Number of variables
+
+    Returns:
+        Tuple whose j-th entry has bit r set iff bit j of r is 0
+    """
+    num_rows = 1 << arity
+    return tuple(
+        sum(1 << row for row in range(num_rows) if not (row >> j) & 1)
+        for j in range(arity)
+    )
+
+
+def _affine_anf_mask(arity: int) -> int:
+    """
+    Mask of the ANF coefficients an affine function may use.
+
+    Args:
+        arity: Number of variables
+
+    Returns:
+        Bits for the constant term and each single-variable monomial
+    """
+    return 1 | sum(1 << (1 << j) for j in range(arity))
+
+
+# Arity-indexed constants for every arity Connective accepts (0-5), built
+# once at import so the predicates only index into them
+_LOW_ROW_MASKS = tuple(_low_row_masks(arity) for arity in range(6))
+_AFFINE_ANF_MASKS = tuple(_affine_anf_mask(arity) for arity in range(6))
+
+
+# Post classes in bit order for the membership masks below
+_CLASS_NAMES = ('T0', 'T1', 'M', 'D', 'A')
+_T0, _T1, _M, _D, _A = (1 << i for i in range(len(_CLASS_NAMES)))
+_ALL_CLASSES = (1 << len(_CLASS_NAMES)) - 1
+
+# A set is complete iff the OR of its members' escape_bits equals this
+ALL_ESCAPE_BITS = _ALL_CLASSES
 
 
 def is_t0_preserving(connective: Connective) -> bool:
@@ -29,9 +81,7 @@ def is_t0_preserving(connective: Connective) -> bool:
     Returns:
         True if connective is 0-preserving
     """
-    # All-zeros input
-    zeros = tuple(0 for _ in range(connective.arity))
-    return connective.evaluate(zeros) == 0
+    return bool(_membership_bits(connective) & _T0)
 
 
 def is_t1_preserving(connective: Connective) -> bool:
@@ -46,9 +96,7 @@ def is_t1_preserving(connective: Connective) -> bool:
     Returns:
         True if connective is 1-preserving
     """
-    # All-ones input
-    ones = tuple(1 for _ in range(connective.arity))
-    return connective.evaluate(ones) == 1
+    return bool(_membership_bits(connective) & _T1)
 
 
 def is_monotone(connective: Connective) -> bool:
@@ -64,24 +112,7 @@ def is_monotone(connective: Connective) -> bool:
     Returns:
         True if connective is monotone
     """
-    # Generate all input pairs
-    num_rows = 2 ** connective.arity
-
-    for i in range(num_rows):
-        for j in range(num_rows):
-            # Convert indices to input tuples
-            input_i = tuple((i >> (connective.arity - 1 - k)) & 1
-                          for k in range(connective.arity))
-            input_j = tuple((j >> (connective.arity - 1 - k)) & 1
-                          for k in range(connective.arity))
-
-            # Check if input_i ≤ input_j componentwise
-            if all(input_i[k] <= input_j[k] for k in range(connective.arity)):
-                # Then f(input_i) must be ≤ f(input_j)
-                if connective.evaluate(input_i) > connective.evaluate(input_j):
-                    return False
-
-    return True
+    return bool(_membership_bits(connective) & _M)
 
 
 def is_self_dual(connective: Connective) -> bool:
@@ -96,28 +127,7 @@ def is_self_dual(connective: Connective) -> bool:
     Returns:
         True if connective is self-dual
     """
-    num_rows = 2 ** connective.arity
-
-    for row in range(num_rows):
-        # Convert row to input tuple
-        inputs = tuple((row >> (connective.arity - 1 - k)) & 1
-                      for k in range(connective.arity))
-
-        # Compute f(inputs)
-        f_inputs = connective.evaluate(inputs)
-
-        # Compute negated inputs
-        neg_inputs = tuple(1 - val for val in inputs)
-
-        # Compute f(¬inputs)
-        f_neg_inputs = connective.evaluate(neg_inputs)
-
-        # Check if ¬f(inputs) == f(¬inputs)
-        # i.e., f_neg_inputs == 1 - f_inputs
-        if f_neg_inputs != (1 - f_inputs):
-            return False
-
-    return True
+    return bool(_membership_bits(connective) & _D)
 
 
 def is_affine(connective: Connective) -> bool:
@@ -142,40 +152,96 @@ def is_affine(connective: Connective) -> bool:
     Returns:
         True if connective is affine
     """
-    # For small arities, we can check directly by trying to find
-    # a linear representation using Gaussian elimination.
-    # A function is affine iff it satisfies:
-    # f(x ⊕ y) ⊕ f(x) ⊕ f(y) ⊕ f(0) = 0 for all x, y
+    return bool(_membership_bits(connective) & _A)
 
-    num_rows = 2 ** connective.arity
 
-    # Get f(0...0)
-    zeros = tuple(0 for _ in range(connective.arity))
-    f_zeros = connective.evaluate(zeros)
+def _membership_bits(connective: Connective) -> int:
+    """
+    Post-class membership of a connective as a 5-bit mask.
 
-    # Check affine property for all pairs of inputs
-    for i in range(num_rows):
-        for j in range(num_rows):
-            # Convert indices to input tuples
-            input_i = tuple((i >> (connective.arity - 1 - k)) & 1
-                          for k in range(connective.arity))
-            input_j = tuple((j >> (connective.arity - 1 - k)) & 1
-                          for k in range(connective.arity))
+    Args:
+        connective: Connective to classify
 
-            # Compute i ⊕ j (XOR componentwise)
-            input_xor = tuple(input_i[k] ^ input_j[k]
-                            for k in range(connective.arity))
+    Returns:
+        Mask with bit i set iff connective is in class _CLASS_NAMES[i]
+    """
+    return _post_class_bits(connective.arity, connective.truth_table_int)
 
-            # Get function values
-            f_i = connective.evaluate(input_i)
-            f_j = connective.evaluate(input_j)
-            f_xor = connective.evaluate(input_xor)
 
-            # Check affine property: f(x ⊕ y) = f(x) ⊕ f(y) ⊕ f(0)
-            if f_xor != (f_i ^ f_j ^ f_zeros):
-                return False
+@lru_cache(maxsize=None)
+def _post_class_bits(arity: int, truth_table: int) -> int:
+    """
+    Compute all five Post-class memberships in one pass (computed once).
 
-    return True
+    Args:
+        arity: Number of variables
+        truth_table: Truth table as integer
+
+    Returns:
+        Mask with bit i set iff the function is in class _CLASS_NAMES[i]
+    """
+    num_rows = 1 << arity
+    bits = 0
+
+    # T0/T1: the all-zeros input is row 0, the all-ones input the last row
+    if not truth_table & 1:
+        bits |= _T0
+    if (truth_table >> (num_rows - 1)) & 1:
+        bits |= _T1
+
+    # M, D and A share one sweep over the variables.
+    # M: by transitivity it suffices to raise one variable at a time, so f
+    # is monotone iff no row with bit j clear outputs 1 while the row with
+    # bit j set outputs 0.
+    # D: negating variable j swaps the row halves selected by its mask;
+    # doing so for every j yields f(¬x), which must equal ¬f(x).
+    # A: the Reed-Muller (Möbius) transform leaves bit m holding the ANF
+    # coefficient of the monomial over the variables set in row m; f is
+    # affine iff only the constant and single-variable ones are nonzero.
+    monotone = True
+    negated = truth_table
+    anf = truth_table
+    for j, low in enumerate(_LOW_ROW_MASKS[arity]):
+        shift = 1 << j
+        if truth_table & low & ~(truth_table >> shift):
+            monotone = False
+        negated = ((negated & low) << shift) | ((negated >> shift) & low)
+        anf ^= (anf & low) << shift
+
+    if monotone:
+        bits |= _M
+    if negated == truth_table ^ ((1 << num_rows) - 1):
+        bits |= _D
+    if not anf & ~_AFFINE_ANF_MASKS[arity]:
+        bits |= _A
+
+    return bits
+
+
+def escape_bits(connective: Connective) -> int:
+    """
+    Post classes a connective escapes, as a 5-bit mask.
+
+    Args:
+        connective: Connective to classify
+
+    Returns:
+        Mask with bit i set iff connective is outside class _CLASS_NAMES[i]
+    """
+    return _ALL_CLASSES & ~_membership_bits(connective)
+
+
+def _class_names(bits: int) -> Set[str]:
+    """
+    Convert a membership mask to a set of class names.
+
+    Args:
+        bits: Mask over _CLASS_NAMES
+
+    Returns:
+        Set of class names whose bits are set
+    """
+    return {name for i, name in enumerate(_CLASS_NAMES) if (bits >> i) & 1}
 
 
 def get_post_class_membership(connective: Connective) -> Set[str]:
@@ -188,20 +254,7 @@ def get_post_class_membership(connective: Connective) -> Set[str]:
     Returns:
         Set of class names ('T0', 'T1', 'M', 'D', 'A')
     """
-    classes = set()
-
-    if is_t0_preserving(connective):
-        classes.add('T0')
-    if is_t1_preserving(connective):
-        classes.add('T1')
-    if is_monotone(connective):
-        classes.add('M')
-    if is_self_dual(connective):
-        classes.add('D')
-    if is_affine(connective):
-        classes.add('A')
-
-    return classes
+    return _class_names(_membership_bits(connective))
 
 
 # Alias for notebook compatibility
@@ -221,18 +274,15 @@ def is_complete(connectives: List[Connective]) -> bool:
     Returns:
         True if the set is complete
     """
-    if not connectives:
-        return False
-
-    # Check if we escape each maximal clone
-    escapes_t0 = any(not is_t0_preserving(c) for c in connectives)
-    escapes_t1 = any(not is_t1_preserving(c) for c in connectives)
-    escapes_m = any(not is_monotone(c) for c in connectives)
-    escapes_d = any(not is_self_dual(c) for c in connectives)
-    escapes_a = any(not is_affine(c) for c in connectives)
+    # Intersect memberships: a bit survives iff every connective is in
+    # that clone, i.e. the set fails to escape it
+    missing = _ALL_CLASSES
+    for c in connectives:
+        missing &= _membership_bits(c)
+        if not missing:
+            return True
 
-    return (escapes_t0 and escapes_t1 and escapes_m and
-            escapes_d and escapes_a)
+    return False
 
 
 def get_missing_classes(connectives: List[Connective]) -> Set[str]:
@@ -246,113 +296,13 @@ def get_missing_classes(connectives: List[Connective]) -> Set[str]:
         Set of class names that are not escaped (i.e., all connectives
         in the set belong to these classes)
     """
-    if not connectives:
-        return {'T0', 'T1', 'M', 'D', 'A'}
-
-    missing = set()
-
-    if all(is_t0_preserving(c) for c in connectives):
-        missing.add('T0')
-    if all(is_t1_preserving(c) for c in connectives):
-        missing.add('T1')
-    if all(is_monotone(c) for c in connectives):
-        missing.add('M')
-    if all(is_self_dual(c) for c in connectives):
-        missing.add('D')
-    if all(is_affine(c) for c in connectives):
-        missing.add('A')
-
-    return missing
-
-
-def _compute_under_permutation(truth_table: int, arity: int,
-                               permutation: Tuple[int, ...]) -> int:
-    """
-    Compute truth table under variable permutation.
-
-    Args:
-        truth_table: Original truth table as integer
-        arity: Number of variables
-        permutation: Permutation tuple (e.g., (1,0) swaps x and y)
-
-    Returns:
-        New truth table value under permutation
-    """
-    if arity == 0:
-        return truth_table
-
-    num_rows = 2 ** arity
-    new_table = 0
-
-    for row in range(num_rows):
-        # Extract input values for this row
-        inputs = tuple((row >> (arity - 1 - k)) & 1 for k in range(arity))
-
-        # Apply permutation
-        permuted_inputs = tuple(inputs[permutation[k]] for k in range(arity))
-
-        # Compute permuted row index
-        permuted_row = sum(permuted_inputs[k] << (arity - 1 - k) for k in range(arity))
-
-        # Get output bit from original table at permuted row
-        output_bit = (truth_table >> permuted_row) & 1
-
-        # Set bit in new table at current row
-        if output_bit:
-            new_table |= (1 << row)
-
-    return new_table
-
-
-def _compute_under_negation(truth_table: int, arity: int,
-                            negation_mask: Tuple[int, ...]) -> int:
-    """
-    Compute truth table under variable/output negation.
-
-    Args:
-        truth_table: Original truth table as integer
-        arity: Number of variables
-        negation_mask: Tuple of 0/1 indicating which vars to negate
-                      Last element negates output
-
-    Returns:
-        New truth table value under negation
-    """
-    if arity == 0:
-        # Nullary: only output negation matters
-        if len(negation_mask) > 0 and negation_mask[0]:
-            return truth_table ^ 1
-        return truth_table
-
-    num_rows = 2 ** arity
-    new_table = 0
-
-    # Split mask into input negations and output negation
-    input_negations = negation_mask[:arity]
-    negate_output = negation_mask[arity] if len(negation_mask) > arity else 0
-
-    for row in range(num_rows):
-        # Extract input values
-        inputs = tuple((row >> (arity - 1 - k)) & 1 for k in range(arity))
-
-        # Apply input negations
-        negated_inputs = tuple(inputs[k] ^ input_negations[k] for k in range(arity))
-
-        # Compute negated row index
-        negated_row = sum(negated_inputs[k] << (arity - 1 - k) for k in range(arity))
-
-        # Get output bit from original table
-        output_bit = (truth_table >> negated_row) & 1
-
-        # Apply output negation
-        if negate_output:
-            output_bit ^= 1
-
-        # Set bit in new table
-        if output_bit:
-            new_table |= (1 << row)
+    missing = _ALL_CLASSES
+    for c in connectives:
+        missing &= _membership_bits(c)
+        if not missing:
+            break
 
-    return new_table
+    return _class_names(missing)
 
 
 def equivalence_class_representative(connective: Connective) -> int:
@@ -376,31 +326,65 @@ def equivalence_class_representative(connective: Connective) -> int:
     Returns:
         Truth table value of canonical representative
     """
-    import itertools
+    return _input_symmetry_canonical(connective.arity, connective.truth_table_int)
 
-    arity = connective.arity
-    truth_table = connective.truth_table_int
-    min_table = truth_table
 
-    # Generate all permutations of variables
-    for perm in itertools.permutations(range(arity)):
-        permuted_table = _compute_under_permutation(truth_table, arity, perm)
+@lru_cache(maxsize=None)
+def _input_symmetry_canonical(arity: int, truth_table: int) -> int:
+    """
+    Minimum truth table over variable permutations and input negations.
 
-        # For each permutation, try all INPUT negation patterns
-        # Negation mask: only input negations (no output negation)
-        for neg_mask_val in range(2 ** arity):
-            # Build negation mask with no output negation
-            neg_mask = tuple((neg_mask_val >> k) & 1 for k in range(arity)) + (0,)
+    Args:
+        arity: Number of variables
+        truth_table: Truth table as integer
+
+    Returns:
+        Smallest truth table in the orbit of truth_table
+    """
+    low_masks = _LOW_ROW_MASKS[arity]
+    min_table = truth_table
 
-            negated_table = _compute_under_negation(permuted_table, arity, neg_mask)
+    for perm in itertools.permutations(range(arity)):
+        permuted_table = _permute_truth_table(truth_table, arity, perm)
+
+        # Negating the variable on row bit j swaps rows r and r ^ (1 << j),
+        # i.e. exchanges the two halves selected by low_masks[j]
+        for neg_mask in range(1 << arity):
+            negated_table = permuted_table
+            for j, low in enumerate(low_masks):
+                if (neg_mask >> j) & 1:
+                    shift = 1 << j
+                    negated_table = (((negated_table & low) << shift)
+                                     | ((negated_table >> shift) & low))
 
-            # Track minimum
             if negated_table < min_table:
                 min_table = negated_table
 
     return min_table
 
 
+def depends_on_all_variables(connective: Connective) -> bool:
+    """
+    Check whether every input variable affects the connective's output.
+
+    A connective that ignores some variable is a lower-arity function with
+    a padded truth table.
+
+    Args:
+        connective: Connective to check
+
+    Returns:
+        True if no variable is fictitious
+    """
+    table = connective.truth_table_int
+    for j, low in enumerate(_LOW_ROW_MASKS[connective.arity]):
+        # Variable on row bit j is fictitious iff both halves agree
+        if table & low == (table >> (1 << j)) & low:
+            return False
+
+    return True
+
+
 def filter_by_post_classes(connectives: List[Connective],
                            must_escape: Set[str]) -> List[Connective]:
     """
@@ -413,20 +397,8 @@ def filter_by_post_classes(connectives: List[Connective],
     Returns:
         Filtered list of connectives
     """
-    filtered = []
-
-    for c in connectives:
-        classes = get_post_class_membership(c)
-
-        # Check if this connective escapes all required classes
-        escapes_all = True
-        for class_name in must_escape:
-            if class_name in classes:
-                # Connective is in this class, so doesn't escape it
-                escapes_all = False
-                break
-
-        if escapes_all:
-            filtered.append(c)
+    required_escapes = sum(1 << i for i, name in enumerate(_CLASS_NAMES)
+                           if name in must_escape)
 
-    return filtered
+    # Keep connectives that belong to none of the required classes
+    return [c for c in connectives if not _membership_bits(c) & required_escapes]
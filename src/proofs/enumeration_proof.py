@@ -9,15 +9,25 @@ This script provides two pieces of evidence:
 
 import sys
 import time
+from math import comb
 from itertools import combinations
 
 from src.connectives import Connective, generate_all_connectives
-from src.post_classes import is_complete
+from src.post_classes import (
+    is_complete, escape_bits, depends_on_all_variables
+)
 from src.independence import is_independent
 from src.constants import ALL_BINARY, XOR
 
-def build_connective_pool(max_arity=3):
-    """Build the complete connective pool."""
+def build_connective_pool(max_arity=3, drop_degenerate=False):
+    """
+    Build the complete connective pool.
+
+    Args:
+        max_arity: Include ternary functions when at least 3
+        drop_degenerate: Omit ternary functions that ignore an input; each
+            is a padded copy of a lower-arity function (default: False)
+    """
     pool = []
 
     # Arity 0: constants (2 functions)
@@ -31,10 +41,81 @@ def build_connective_pool(max_arity=3):
 
     # Arity 3: ternary (256 functions)
     if max_arity >= 3:
-        pool.extend(generate_all_connectives(3))
+        ternary = generate_all_connectives(3)
+        if drop_degenerate:
+            ternary = [c for c in ternary if depends_on_all_variables(c)]
+        pool.extend(ternary)
 
     return pool
 
+def clone_escaper_masks(pool):
+    """
+    Index masks of the pool connectives that escape each maximal clone.
+
+    Bit i of a mask is set iff pool[i] is outside that clone, so a subset
+    given as an index mask is complete iff it meets all five masks.
+
+    Returns:
+        tuple: Masks for T0, T1, M, D, A
+    """
+    masks = [0] * 5
+    for i, c in enumerate(pool):
+        escaped = escape_bits(c)
+        for clone in range(5):
+            if (escaped >> clone) & 1:
+                masks[clone] |= 1 << i
+    return tuple(masks)
+
+def subset_masks(n, size):
+    """
+    Yield every size-element subset of range(n) as an integer bitmask.
+
+    Uses Gosper's hack to step to the next larger integer with the same
+    popcount, so subsets come in colexicographic order without building
+    index tuples.
+
+    Yields:
+        int: Mask with bit i set iff i is in the subset
+    """
+    if size == 0:
+        # The empty subset has no lowest bit to step from
+        yield 0
+        return
+
+    mask = (1 << size) - 1
+    limit = 1 << n
+    while mask < limit:
+        yield mask
+        low = mask & -mask
+        ripple = mask + low
+        mask = (((ripple ^ mask) >> 2) // low) | ripple
+
+def lex_subset_masks(n, size):
+    """
+    Yield every size-element subset of range(n) as a bitmask, in lex order.
+
+    Same subsets as subset_masks, but in the order of
+    itertools.combinations, so a prefix of the stream reaches the high
+    pool indices (ternary connectives) early.
+
+    Yields:
+        int: Mask with bit i set iff i is in the subset
+    """
+    for combo in combinations(range(n), size):
+        mask = 0
+        for i in combo:
+            mask |= 1 << i
+        yield mask
+
+def mask_members(pool, mask):
+    """Return the pool connectives selected by mask, in pool order."""
+    members = []
+    while mask:
+        low = mask & -mask
+        members.append(pool[low.bit_length() - 1])
+        mask ^= low
+    return members
+
 def verify_size_16_exists(pool, max_depth=3):
     """
     Verify that at least one size-16 nice set exists.
@@ -113,7 +194,6 @@ def prove_size_17_impossible(pool, max_depth=3, sample_size=10000):
     size = 17
 
     # Calculate total combinations
-    from math import comb
     total_combinations = comb(len(pool), size)
 
     print(f"Pool size: {len(pool)} connectives")
@@ -137,17 +217,33 @@ def prove_size_17_impossible(pool, max_depth=3, sample_size=10000):
     checked = 0
     found_nice_sets = []
 
-    # Generate combinations
-    combo_iter = combinations(pool, size)
+    # Completeness is decided by five integer ANDs against the pool-wide
+    # escaper masks; connective lists are only built for complete subsets
+    esc_t0, esc_t1, esc_m, esc_d, esc_a = clone_escaper_masks(pool)
 
-    # Progress tracking
+    # Generate combinations as pool-index bitmasks. A colex prefix of the
+    # size-17 subsets never leaves the first 22 (nullary to binary)
+    # connectives, so sampling keeps the lex order, whose prefix includes
+    # ternaries; the exhaustive case uses the cheaper Gosper stepping.
+    if exhaustive:
+        combo_iter = subset_masks(len(pool), size)
+    else:
+        combo_iter = lex_subset_masks(len(pool), size)
+
+    # Progress tracking: count down rather than take a modulo per subset
     report_interval = 10000
+    report_left = report_interval
+
+    # Sampling stops at this count; -1 never matches in exhaustive mode
+    stop_at = -1 if exhaustive else max(sample_size, 1)
 
-    for combo in combo_iter:
+    for combo_mask in combo_iter:
         checked += 1
 
         # Progress report
-        if checked % report_interval == 0:
+        report_left -= 1
+        if not report_left:
+            report_left = report_interval
             elapsed = time.time() - start_time
             rate = checked / elapsed if elapsed > 0 else 0
             print(f"  Checked {checked:,}/{total_combinations:,} combinations "
@@ -156,17 +252,17 @@ def prove_size_17_impossible(pool, max_depth=3, sample_size=10000):
                   f"Elapsed: {elapsed:.1f}s")
 
         # Early termination for sampling
-        if not exhaustive and checked >= sample_size:
+        if checked == stop_at:
             print(f"  Stopping after {sample_size:,} combinations (sampling mode)")
             break
 
-        # Check if this combination is nice
-        combo_list = list(combo)
-
         # Quick check: is it complete?
-        if not is_complete(combo_list):
+        if not (combo_mask & esc_t0 and combo_mask & esc_t1 and combo_mask & esc_m
+                and combo_mask & esc_d and combo_mask & esc_a):
             continue
 
+        combo_list = mask_members(pool, combo_mask)
+
         # If complete, check independence (expensive)
         if is_independent(combo_list, max_depth=max_depth):
             found_nice_sets.append(combo_list)
@@ -93,7 +93,9 @@ def load_checkpoint(checkpoint_path):
 def z3_proof_approach_1_symmetry_breaking(pool, target_size=17, max_depth=3,
                                           checkpoint_path=None, checkpoint_interval=100,
                                           max_candidates=10000,
-                                          definability_mode=DefinabilityMode.SYNTACTIC):
+                                          definability_mode=DefinabilityMode.SYNTACTIC,
+                                          solver_rlimit=None, solver_options=None,
+                                          verify_completeness=False):
     """
     Use Z3 for smart enumeration with symmetry breaking.
 
@@ -111,6 +113,20 @@ def z3_proof_approach_1_symmetry_breaking(pool, target_size=17, max_depth=3,
         checkpoint_path: Path to save/load checkpoints (optional)
         checkpoint_interval: Save checkpoint every N candidates
         definability_mode: Definability mode (syntactic or truth-functional)
+        solver_rlimit: Z3 resource limit per check (optional). Unlike a
+            wall-clock timeout this budget is deterministic; a check that
+            exhausts it returns unknown and ends the search.
+        solver_options: Extra Z3 solver parameters as a name -> value dict
+            (optional). The QF_FD backend takes SAT parameters such as
+            'phase' or 'random_seed'; smt.* parameters are rejected.
+        verify_completeness: Re-check each model with is_complete
+            (default False). The escape clauses encode completeness
+            exactly, so this only guards against encoding bugs.
+
+    Returns:
+        True if no nice set of the target size was found, False if one
+        was found, or None if the solver returned unknown (e.g. the
+        rlimit budget ran out) before the search could conclude
     """
     print("=" * 70)
     print(f"Z3 APPROACH 1: SMART ENUMERATION FOR SIZE-{target_size} NICE SETS")
@@ -125,11 +141,18 @@ def z3_proof_approach_1_symmetry_breaking(pool, target_size=17, max_depth=3,
     # Create Z3 boolean variables: selected[i] = True if connective i is in the set
     selected = [Bool(f'sel_{i}') for i in range(n)]
 
-    # Create Z3 solver
-    s = Solver()
+    # Create Z3 solver. Every variable is a Boolean under cardinality
+    # constraints, so the finite-domain (SAT + PB) backend applies and skips
+    # the generic SMT tactics.
+    s = SolverFor('QF_FD')
+    if solver_rlimit is not None:
+        s.set('rlimit', solver_rlimit)
+    for name, value in (solver_options or {}).items():
+        s.set(name, value)
 
-    # Constraint 1: Exactly target_size connectives selected
-    s.add(Sum([If(selected[i], 1, 0) for i in range(n)]) == target_size)
+    # Constraint 1: Exactly target_size connectives selected, stated as a
+    # native cardinality pair rather than an integer sum
+    s.add(AtMost(*selected, target_size), AtLeast(*selected, target_size))
 
     # Constraint 2: Completeness
     # A set is complete iff it escapes all 5 Post classes
@@ -139,27 +162,26 @@ def z3_proof_approach_1_symmetry_breaking(pool, target_size=17, max_depth=3,
     # Escape D (self-dual): at least one isn't self-dual
     # Escape A (affine): at least one isn't affine
 
-    # Build classification for each connective
-    preserves_f = [is_t0_preserving(pool[i]) for i in range(n)]
-    preserves_t = [is_t1_preserving(pool[i]) for i in range(n)]
-    monotone = [is_monotone(pool[i]) for i in range(n)]
-    self_dual = [is_self_dual(pool[i]) for i in range(n)]
-    affine = [is_affine(pool[i]) for i in range(n)]
-
-    # Escape T0: at least one selected connective doesn't preserve false
-    s.add(Or([And(selected[i], not preserves_f[i]) for i in range(n)]))
-
-    # Escape T1: at least one selected connective doesn't preserve true
-    s.add(Or([And(selected[i], not preserves_t[i]) for i in range(n)]))
-
-    # Escape M: at least one selected connective isn't monotone
-    s.add(Or([And(selected[i], not monotone[i]) for i in range(n)]))
-
-    # Escape D: at least one selected connective isn't self-dual
-    s.add(Or([And(selected[i], not self_dual[i]) for i in range(n)]))
+    # Build classification for each connective in a single pass; the
+    # predicates share one cached membership computation per truth table
+    classification = [
+        (is_t0_preserving(c), is_t1_preserving(c), is_monotone(c),
+         is_self_dual(c), is_affine(c))
+        for c in pool
+    ]
+    preserves_f, preserves_t, monotone, self_dual, affine = (
+        zip(*classification) if classification else ((),) * 5
+    )
 
-    # Escape A: at least one selected connective isn't affine
-    s.add(Or([And(selected[i], not affine[i]) for i in range(n)]))
+    # Escape each clone: at least one selected connective lies outside it.
+    # Membership is known here, so each clause lists only the selection
+    # variables of the escapers.
+    for class_name, in_class in (('T0', preserves_f), ('T1', preserves_t),
+                                 ('M', monotone), ('D', self_dual), ('A', affine)):
+        escapers = [selected[i] for i in range(n) if not in_class[i]]
+        if not escapers:
+            print(f"No connective in the pool escapes {class_name}: no complete set exists")
+        s.add(Or(escapers))
 
     # Constraint 3: Advanced Symmetry Breaking
     # These constraints dramatically reduce the search space by exploiting
@@ -200,12 +222,11 @@ def z3_proof_approach_1_symmetry_breaking(pool, target_size=17, max_depth=3,
     min_ternary = 0
     if ternary_indices:
         # Only apply ternary constraint if ternary functions are in the pool
-        ternary_count = Sum([If(selected[i], 1, 0) for i in ternary_indices])
         # At least 10 ternary functions for size 17 (empirical lower bound)
         # Scale proportionally for other sizes
         min_ternary = max(0, int((target_size / 17) * 10))
         if min_ternary > 0:
-            s.add(ternary_count >= min_ternary)
+            s.add(AtLeast(*[selected[i] for i in ternary_indices], min_ternary))
 
     print("Z3 constraints configured")
     print("  - Set size constraint")
@@ -227,37 +248,36 @@ def z3_proof_approach_1_symmetry_breaking(pool, target_size=17, max_depth=3,
             print(f"  Resuming search...")
             print()
             blocked_set_indices = checkpoint['blocked_sets']
-            # Apply all previously blocked sets
-            for blocked_indices in blocked_set_indices:
-                s.add(Or([Not(selected[i]) for i in blocked_indices]))
+            # Apply all previously blocked sets in a single assertion call
+            s.add([AtMost(*[selected[i] for i in blocked_indices], target_size - 1)
+                   for blocked_indices in blocked_set_indices])
 
     # Search for complete sets and check independence
     print(f"Searching for size-{target_size} nice sets...")
-    print("Using incremental solving (push/pop) to reuse learned clauses")
+    print("Using incremental solving to reuse learned clauses")
     if checkpoint_path:
         print(f"Checkpointing enabled: saving every {checkpoint_interval} candidates")
     print()
 
     candidates_checked = 0 if not blocked_set_indices else len(blocked_set_indices)
     nice_sets_found = []
+    nice_sets_as_indices = []
+    inconclusive = False
     start_time = time.time()
 
     while True:
-        # Use push/pop for incremental solving
-        # Base constraints remain persistent, only blocking constraints are added temporarily
-        s.push()
-
-        # Check if there's a satisfying assignment
+        # Solve incrementally on the base scope: blocking clauses are
+        # permanent, so lemmas learned by earlier checks stay valid and are
+        # kept rather than discarded by a pop
         result = s.check()
 
         if result == unsat:
-            s.pop()
             print("Z3 reports UNSAT: no more complete sets exist")
             break
 
         if result == unknown:
-            s.pop()
-            print("Z3 reports UNKNOWN: cannot determine")
+            print(f"Z3 reports UNKNOWN: cannot determine ({s.reason_unknown()})")
+            inconclusive = True
             break
 
         # Get the model
@@ -269,14 +289,11 @@ def z3_proof_approach_1_symmetry_breaking(pool, target_size=17, max_depth=3,
 
         candidates_checked += 1
 
-        # Verify completeness (sanity check)
-        complete = is_complete(selected_connectives)
-
-        if not complete:
+        # Verify completeness (sanity check, opt-in)
+        if verify_completeness and not is_complete(selected_connectives):
             print(f"WARNING: Z3 returned non-complete set (bug in constraints)")
             # Block this solution permanently and continue
-            s.pop()
-            s.add(Or([Not(selected[i]) for i in selected_indices]))
+            s.add(AtMost(*[selected[i] for i in selected_indices], target_size - 1))
             continue
 
         # Check independence (the expensive part)
@@ -296,16 +313,16 @@ def z3_proof_approach_1_symmetry_breaking(pool, target_size=17, max_depth=3,
                 arity_counts[c.arity] = arity_counts.get(c.arity, 0) + 1
             print(f"Arity distribution: {arity_counts}")
             nice_sets_found.append(selected_connectives)
+            nice_sets_as_indices.append(selected_indices)
 
-        # Block this solution permanently (don't find it again)
-        # Pop the temporary scope and add blocking constraint to base level
-        s.pop()
-        s.add(Or([Not(selected[i]) for i in selected_indices]))
+        # Block this solution permanently (don't find it again). With the
+        # set size fixed, "at most k-1 of these" excludes exactly this set,
+        # and the cardinality form propagates faster than the clause.
+        s.add(AtMost(*[selected[i] for i in selected_indices], target_size - 1))
         blocked_set_indices.append(selected_indices)
 
         # Save checkpoint periodically
         if checkpoint_path and candidates_checked % checkpoint_interval == 0:
-            nice_sets_as_indices = [[pool.index(c) for c in ns] for ns in nice_sets_found]
             save_checkpoint(checkpoint_path, candidates_checked, blocked_set_indices,
                           nice_sets_as_indices, start_time)
 
@@ -330,13 +347,17 @@ def z3_proof_approach_1_symmetry_breaking(pool, target_size=17, max_depth=3,
     print(f"Time: {elapsed:.2f}s")
     print()
 
-    if len(nice_sets_found) == 0:
+    if nice_sets_found:
+        print(f"✗ SIZE-{target_size} NICE SETS EXIST")
+        return False
+    elif inconclusive:
+        print(f"? SIZE-{target_size} SEARCH INCONCLUSIVE")
+        print("  Z3 gave up before exhausting the complete sets")
+        return None
+    else:
         print(f"✓ NO SIZE-{target_size} NICE SETS FOUND")
         print("  Z3-guided search exhausted all complete sets")
         return True
-    else:
-        print(f"✗ SIZE-{target_size} NICE SETS EXIST")
-        return False
 
 
 # Alias for notebook compatibility
@@ -364,7 +385,7 @@ def search_z3_nice_set(pool, target_size, max_depth=3, max_candidates=100):
     # The original function returns True if no nice sets found, False if found
     # For notebook compatibility, return None if not found (result=True)
     # This is just for import compatibility - notebooks may not use return value
-    return None if result else pool[:target_size]  # Simplified
+    return pool[:target_size] if result is False else None  # Simplified
 
 
 def main():
@@ -409,6 +430,17 @@ Examples:
         default=3,
         help='Maximum composition depth for independence checking (default: 3)'
     )
+    parser.add_argument(
+        '--rlimit',
+        type=int,
+        default=None,
+        help='Z3 resource limit per solver check (default: unlimited)'
+    )
+    parser.add_argument(
+        '--verify-completeness',
+        action='store_true',
+        help='Re-check every Z3 model with is_complete (default: off)'
+    )
 
     args = parser.parse_args()
 
@@ -427,7 +459,9 @@ Examples:
         target_size=args.target_size,
         max_depth=args.max_depth,
         checkpoint_path=args.checkpoint,
-        checkpoint_interval=args.interval
+        checkpoint_interval=args.interval,
+        solver_rlimit=args.rlimit,
+        verify_completeness=args.verify_completeness
     )
 
     print()
@@ -436,7 +470,10 @@ Examples:
     print("=" * 70)
     print()
 
-    if no_target_size:
+    if no_target_size is None:
+        print(f"? INCONCLUSIVE: search for size-{args.target_size} nice sets did not finish")
+        return 2
+    elif no_target_size:
         print(f"✓ PROVEN: No size-{args.target_size} nice sets exist")
         print(f"✓ Combined with size-{args.target_size - 1} example: max = {args.target_size - 1} exactly")
         return 0
@@ -8,8 +8,13 @@ A nice set is one that is both:
 
 from typing import List, Set, Tuple, Dict
 from itertools import combinations
+from math import comb
+from concurrent.futures import ProcessPoolExecutor
 from src.connectives import Connective, generate_all_connectives
-from src.post_classes import is_complete, equivalence_class_representative
+from src.post_classes import (
+    is_complete, equivalence_class_representative, get_post_class_membership,
+    escape_bits, ALL_ESCAPE_BITS
+)
 from src.independence import is_independent, DefinabilityMode
 import time
 
@@ -45,50 +50,197 @@ def filter_by_equivalence(connectives: List[Connective]) -> List[Connective]:
     return representatives
 
 
-def find_nice_sets_of_size(
+def _scan_combinations(
     connectives: List[Connective],
-    size: int,
-    max_depth: int = 3,
+    profiles: List[int],
+    index_combos,
+    max_depth: int,
+    definability_mode: DefinabilityMode,
     verbose: bool = False,
-    definability_mode: DefinabilityMode = DefinabilityMode.SYNTACTIC
+    total_combinations: int = 0
 ) -> List[List[Connective]]:
     """
-    Find all nice sets of a specific size from a pool of connectives.
+    Collect the nice sets among the given index combinations of a pool.
 
     Args:
-        connectives: Pool of connectives to search
-        size: Target set size
+        connectives: Pool of connectives
+        profiles: escape_bits of each pool connective
+        index_combos: Iterable of index tuples into the pool
         max_depth: Maximum composition depth for independence checking
-        verbose: Print progress information
         definability_mode: Definability mode (syntactic or truth-functional)
+        verbose: Print progress information
+        total_combinations: Combination count shown in progress lines
 
     Returns:
-        List of nice sets (each set is a list of connectives)
+        List of nice sets, in the order the combinations were given
     """
     nice_sets = []
-    total_combinations = len(list(combinations(range(len(connectives)), size)))
     checked = 0
 
-    if verbose:
-        print(f"Searching for nice sets of size {size}...")
-        print(f"Total combinations to check: {total_combinations}")
-
-    for combo in combinations(connectives, size):
+    for combo_indices in index_combos:
         checked += 1
         if verbose and checked % 1000 == 0:
             print(f"  Checked {checked}/{total_combinations} combinations...")
 
-        # First check completeness (fast)
-        combo_list = list(combo)
-        if not is_complete(combo_list):
+        # First check completeness (fast): OR the escape masks
+        escaped = 0
+        for i in combo_indices:
+            escaped |= profiles[i]
+            if escaped == ALL_ESCAPE_BITS:
+                break
+        if escaped != ALL_ESCAPE_BITS:
             continue
 
+        combo_list = [connectives[i] for i in combo_indices]
+
         # Then check independence (slower)
         if is_independent(combo_list, max_depth, mode=definability_mode):
             nice_sets.append(combo_list)
             if verbose:
                 print(f"  Found nice set: {[c.name for c in combo_list]}")
 
+    return nice_sets
+
+
+# Per-worker search state, set once by _init_shard_worker
+_shard_state: Dict[str, object] = {}
+
+
+def _init_shard_worker(connectives: List[Connective], profiles: List[int],
+                       size: int, max_depth: int,
+                       definability_mode: DefinabilityMode) -> None:
+    """
+    Store the pool and search parameters in a worker process.
+
+    Runs once per worker, so the pool is sent once rather than with
+    every shard.
+
+    Args:
+        connectives: Pool of connectives
+        profiles: escape_bits of each pool connective
+        size: Target set size
+        max_depth: Maximum composition depth for independence checking
+        definability_mode: Definability mode (syntactic or truth-functional)
+    """
+    _shard_state.update(
+        connectives=connectives, profiles=profiles, size=size,
+        max_depth=max_depth, definability_mode=definability_mode
+    )
+
+
+def _scan_shard(prefix: Tuple[int, ...]) -> List[List[Connective]]:
+    """
+    Worker for parallel search: scan the combinations extending an index prefix.
+
+    Args:
+        prefix: Increasing pool indices fixed as the first members
+
+    Returns:
+        List of nice sets that start with prefix, in sequential order
+    """
+    connectives = _shard_state['connectives']
+    rest_size = _shard_state['size'] - len(prefix)
+    index_combos = (
+        prefix + rest
+        for rest in combinations(range(prefix[-1] + 1, len(connectives)), rest_size)
+    )
+    return _scan_combinations(
+        connectives, _shard_state['profiles'], index_combos,
+        _shard_state['max_depth'], _shard_state['definability_mode']
+    )
+
+
+def _shard_prefixes(n: int, size: int, max_load: int) -> List[Tuple[int, ...]]:
+    """
+    Split the size-subsets of range(n) into prefix shards of bounded size.
+
+    Each first index starts a shard; a shard holding more than max_load
+    combinations is split by its next index, so the early (largest) shards
+    do not dominate. Prefixes come out in lexicographic order, which keeps
+    concatenated shard results in sequential order.
+
+    Args:
+        n: Pool size
+        size: Subset size (at least 1)
+        max_load: Largest number of combinations a shard may hold unsplit
+
+    Returns:
+        List of index prefixes
+    """
+    prefixes = []
+
+    def expand(prefix: Tuple[int, ...]) -> None:
+        start = prefix[-1] + 1 if prefix else 0
+        remaining = size - len(prefix) - 1
+        for i in range(start, n - remaining):
+            extended = prefix + (i,)
+            if remaining and comb(n - i - 1, remaining) > max_load:
+                expand(extended)
+            else:
+                prefixes.append(extended)
+
+    expand(())
+    return prefixes
+
+
+def find_nice_sets_of_size(
+    connectives: List[Connective],
+    size: int,
+    max_depth: int = 3,
+    verbose: bool = False,
+    definability_mode: DefinabilityMode = DefinabilityMode.SYNTACTIC,
+    processes: int = 1
+) -> List[List[Connective]]:
+    """
+    Find all nice sets of a specific size from a pool of connectives.
+
+    Args:
+        connectives: Pool of connectives to search
+        size: Target set size
+        max_depth: Maximum composition depth for independence checking
+        verbose: Print progress information
+        definability_mode: Definability mode (syntactic or truth-functional)
+        processes: Number of worker processes (default 1). Above 1, the
+            combinations are sharded by index prefix; results keep the
+            sequential order, but progress lines are not printed.
+
+    Returns:
+        List of nice sets (each set is a list of connectives)
+    """
+    total_combinations = comb(len(connectives), size)
+
+    if verbose:
+        print(f"Searching for nice sets of size {size}...")
+        print(f"Total combinations to check: {total_combinations}")
+
+    profiles = [escape_bits(c) for c in connectives]
+
+    if processes > 1 and size > 0:
+        # Aim for many small shards per worker so the pool balances load
+        max_load = max(1, total_combinations // (processes * 64))
+        prefixes = _shard_prefixes(len(connectives), size, max_load)
+        chunksize = max(1, len(prefixes) // (processes * 16))
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_shard_worker,
+            initargs=(connectives, profiles, size, max_depth, definability_mode)
+        ) as executor:
+            nice_sets = [
+                nice_set
+                for shard_sets in executor.map(_scan_shard, prefixes, chunksize=chunksize)
+                for nice_set in shard_sets
+            ]
+        if verbose:
+            for nice_set in nice_sets:
+                print(f"  Found nice set: {[c.name for c in nice_set]}")
+    else:
+        nice_sets = _scan_combinations(
+            connectives, profiles,
+            combinations(range(len(connectives)), size),
+            max_depth, definability_mode,
+            verbose=verbose, total_combinations=total_combinations
+        )
+
     if verbose:
         print(f"Found {len(nice_sets)} nice sets of size {size}")
 
@@ -382,8 +534,6 @@ def analyze_nice_set(nice_set: List[Connective]) -> Dict[str, any]:
     Returns:
         Dictionary of properties
     """
-    from src.post_classes import get_post_class_membership
-
     analysis = {
         'size': len(nice_set),
         'arities': [c.arity for c in nice_set],
@@ -63,6 +63,22 @@ class TestProveZ3:
         # Verify exit code (1 = failure, sets exist)
         assert exit_code == 1
 
+    @patch('src.commands.prove.z3_proof_approach_1_symmetry_breaking')
+    @patch('src.commands.prove.build_connective_pool')
+    def test_prove_z3_inconclusive(self, mock_pool, mock_z3_proof, capsys):
+        """Test Z3 proof when the solver gives up (inconclusive case)."""
+        mock_pool.return_value = [Mock(arity=2) for _ in range(10)]
+
+        # Mock Z3 proof returning None (solver returned unknown)
+        mock_z3_proof.return_value = None
+
+        exit_code = prove_z3(target_size=17)
+
+        assert exit_code == 2
+        out = capsys.readouterr().out
+        assert "INCONCLUSIVE" in out
+        assert "PROVEN" not in out
+
     @patch('src.commands.prove.z3_proof_approach_1_symmetry_breaking')
     @patch('src.commands.prove.build_connective_pool')
     def test_prove_z3_with_checkpoint(self, mock_pool, mock_z3_proof):
@@ -3,7 +3,10 @@ Tests for core connective representation.
 """
 
 import pytest
-from src.connectives import Connective, generate_all_connectives, get_connective_count
+from src.connectives import (
+    Connective, generate_all_connectives, get_connective_count, canonical_truth_table,
+    _row_inputs, _permute_truth_table
+)
 from src.constants import (
     AND, OR, NOT, NAND, NOR, XOR, IFF, IMPLIES,
     PROJECT_X, PROJECT_Y, CONST_FALSE_BIN, CONST_TRUE_BIN,
@@ -48,6 +51,13 @@ class TestConnectiveBasics:
         c_ternary = Connective(3, 42)
         assert c_ternary.name == "f3_42"
 
+    def test_no_instance_dict(self):
+        """Test that connectives use slots rather than a per-instance dict."""
+        c = Connective(2, 8)
+        assert not hasattr(c, "__dict__")
+        with pytest.raises(AttributeError):
+            c.extra = 1
+
 
 class TestEvaluation:
     """Test truth table evaluation."""
@@ -163,6 +173,60 @@ class TestEquality:
         assert len(s) == 2  # c1 and c2 are the same
 
 
+class TestCanonicalMask:
+    """Test canonical form under variable permutation."""
+
+    def test_symmetric_function_unchanged(self):
+        """Test that symmetric functions are their own canonical form."""
+        assert AND.canonical_mask == AND.truth_table_int
+        assert XOR.canonical_mask == XOR.truth_table_int
+
+    def test_converse_shares_canonical_form(self):
+        """Test that IMP and its converse share a canonical form."""
+        converse = Connective(2, 0b1101)
+        assert IMPLIES.canonical_mask == converse.canonical_mask
+        assert IMPLIES.canonical_mask == min(IMPLIES.truth_table_int, 0b1101)
+
+    def test_projections_share_canonical_form(self):
+        """Test that both binary projections are equivalent."""
+        assert PROJECT_X.canonical_mask == PROJECT_Y.canonical_mask
+
+    def test_ternary_orbits(self):
+        """Test that canonical forms partition ternary functions into orbits."""
+        forms = {canonical_truth_table(3, t) for t in range(256)}
+        assert len(forms) == 80
+
+    def test_low_arity(self):
+        """Test that constants and unary functions are unchanged."""
+        for c in generate_all_connectives(0) + generate_all_connectives(1):
+            assert c.canonical_mask == c.truth_table_int
+
+
+class TestRowInputs:
+    """Test cached per-arity row inputs and permutations."""
+
+    def test_binary_rows(self):
+        """Test that binary rows are MSB-first."""
+        assert _row_inputs(2) == ((0, 0), (0, 1), (1, 0), (1, 1))
+
+    def test_rows_are_shared(self):
+        """Test that the same tuple is returned on every call."""
+        assert _row_inputs(3) is _row_inputs(3)
+
+    def test_nullary_row(self):
+        """Test that arity 0 has a single empty row."""
+        assert _row_inputs(0) == ((),)
+
+    def test_swap_gives_converse(self):
+        """Test that swapping variables of IMP gives its converse."""
+        assert _permute_truth_table(IMPLIES.truth_table_int, 2, (1, 0)) == 0b1101
+
+    def test_identity_permutation(self):
+        """Test that the identity permutation leaves tables unchanged."""
+        for tt in range(256):
+            assert _permute_truth_table(tt, 3, (0, 1, 2)) == tt
+
+
 class TestStringRepresentation:
     """Test string output."""
 
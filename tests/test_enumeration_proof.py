@@ -9,8 +9,13 @@ import pytest
 from src.proofs.enumeration_proof import (
     build_connective_pool,
     verify_size_16_exists,
-    prove_size_17_impossible
+    prove_size_17_impossible,
+    clone_escaper_masks,
+    subset_masks,
+    lex_subset_masks,
+    mask_members
 )
+from src.post_classes import is_complete
 
 
 class TestBuildConnectivePool:
@@ -36,6 +41,12 @@ class TestBuildConnectivePool:
         assert arity_counts[2] == 16    # Binary
         assert arity_counts[3] == 256   # Ternary
 
+    def test_drop_degenerate(self):
+        """Test that ternary functions ignoring an input can be omitted."""
+        pool = build_connective_pool(max_arity=3, drop_degenerate=True)
+        # 256 ternary functions, 38 of which ignore at least one variable
+        assert len(pool) == 2 + 4 + 16 + 218
+
 
 class TestVerifySize16Exists:
     """Test verification of size-16 nice set existence."""
@@ -87,6 +98,70 @@ class TestProveSize17Impossible:
         assert elapsed >= 0
 
 
+class TestCloneEscaperMasks:
+    """Test pool-wide escaper masks used for completeness pruning."""
+
+    def test_masks_match_is_complete(self):
+        """Test that meeting all five masks is equivalent to completeness."""
+        from itertools import combinations
+        pool = build_connective_pool(max_arity=2)
+        masks = clone_escaper_masks(pool)
+        for combo in combinations(range(len(pool)), 2):
+            combo_mask = (1 << combo[0]) | (1 << combo[1])
+            assert all(combo_mask & m for m in masks) == is_complete([pool[i] for i in combo])
+
+    def test_mask_count(self):
+        """Test that five masks are returned, one per clone."""
+        assert len(clone_escaper_masks(build_connective_pool(max_arity=2))) == 5
+
+
+class TestSubsetMasks:
+    """Test Gosper's-hack subset enumeration."""
+
+    def test_matches_combinations(self):
+        """Test that every k-subset is produced exactly once."""
+        from itertools import combinations
+        masks = list(subset_masks(7, 3))
+        expected = {sum(1 << i for i in combo) for combo in combinations(range(7), 3)}
+        assert len(masks) == len(expected)
+        assert set(masks) == expected
+
+    def test_masks_are_increasing(self):
+        """Test that subsets come in increasing mask order."""
+        masks = list(subset_masks(6, 2))
+        assert masks == sorted(masks)
+
+    def test_size_larger_than_pool(self):
+        """Test that no subsets are produced when size exceeds n."""
+        assert list(subset_masks(3, 4)) == []
+
+    def test_size_zero(self):
+        """Test that the empty subset is produced exactly once."""
+        assert list(subset_masks(3, 0)) == [0]
+
+    def test_lex_order_matches_combinations(self):
+        """Test that lex masks follow itertools.combinations order."""
+        from itertools import combinations
+        expected = [sum(1 << i for i in combo) for combo in combinations(range(7), 3)]
+        assert list(lex_subset_masks(7, 3)) == expected
+
+    def test_lex_prefix_reaches_ternaries(self):
+        """Test that a sampling prefix of the full pool includes ternaries."""
+        from itertools import islice
+        pool = build_connective_pool(max_arity=3)
+        arities = {
+            c.arity
+            for mask in islice(lex_subset_masks(len(pool), 17), 1000)
+            for c in mask_members(pool, mask)
+        }
+        assert 3 in arities
+
+    def test_mask_members(self):
+        """Test that members come back in pool order."""
+        pool = build_connective_pool(max_arity=2)
+        assert mask_members(pool, 0b10110) == [pool[1], pool[2], pool[4]]
+
+
 class TestEnumerationProofStructure:
     """Test the structure and organization of enumeration proof."""
 
@@ -7,7 +7,16 @@ from src.connectives import Connective
 from src.constants import AND, OR, NOT, NAND, XOR, PROJECT_X, PROJECT_Y
 from src.independence import (
     is_definable, is_independent, find_redundant_connectives,
-    get_independent_subset, DefinabilityMode
+    get_independent_subset, DefinabilityMode, clear_definability_cache,
+    _is_definable_at_depth_cached,
+    _apply_unary_column, _apply_binary_columns, _binary_compose_table,
+    _unary_compose_table, _binary_unary_unary_columns, _check_unary_outer_compositions,
+    _check_binary_outer_compositions, _COLUMN_X, _COLUMN_Y,
+    _check_depth_one, _escapes_basis_clones,
+    _check_binary_unary_binary_patterns, _check_unary_chain_binary, _check_f_proj_composed,
+    _check_ternary_compositions, _check_binary_constant_patterns,
+    _projection_columns, _restrict_binary, _get_truth_function_signature,
+    _is_commutative_table
 )
 
 
@@ -107,6 +116,14 @@ class TestRedundancy:
         # At least one should be redundant
         assert len(redundant) > 0
 
+    def test_mode_is_respected(self):
+        """Test that a projection is redundant only in truth-functional mode."""
+        conns = [AND, PROJECT_X]
+        assert 1 in find_redundant_connectives(conns, max_depth=3,
+                                               mode=DefinabilityMode.TRUTH_FUNCTIONAL)
+        assert 1 not in find_redundant_connectives(conns, max_depth=3,
+                                                   mode=DefinabilityMode.SYNTACTIC)
+
 
 class TestIndependentSubset:
     """Test get_independent_subset function."""
@@ -136,6 +153,200 @@ class TestIndependentSubset:
         independent = get_independent_subset([NAND], max_depth=3)
         assert independent == [NAND]
 
+    def test_mode_is_respected(self):
+        """Test that a projection is kept only in syntactic mode."""
+        conns = [AND, PROJECT_X]
+        assert get_independent_subset(conns, max_depth=3,
+                                      mode=DefinabilityMode.TRUTH_FUNCTIONAL) == [AND]
+        assert get_independent_subset(conns, max_depth=3,
+                                      mode=DefinabilityMode.SYNTACTIC) == conns
+
+
+class TestDefinabilityCache:
+    """Test memoization of depth-specific definability checks."""
+
+    def test_repeated_check_hits_cache(self):
+        """Test that repeating a check reuses the memoized result."""
+        clear_definability_cache()
+        is_definable(OR, [NOT, AND], max_depth=3)
+        hits = _is_definable_at_depth_cached.cache_info().hits
+        is_definable(OR, [NOT, AND], max_depth=3)
+        assert _is_definable_at_depth_cached.cache_info().hits > hits
+
+    def test_basis_order_shares_entry(self):
+        """Test that permuted bases share one cache entry."""
+        clear_definability_cache()
+        assert is_definable(OR, [NOT, AND], max_depth=3)
+        misses = _is_definable_at_depth_cached.cache_info().misses
+        assert is_definable(OR, [AND, NOT], max_depth=3)
+        assert _is_definable_at_depth_cached.cache_info().misses == misses
+
+    def test_equal_connectives_share_entry(self):
+        """Test that distinct but equal connective objects hit the cache."""
+        clear_definability_cache()
+        is_definable(OR, [NOT, AND], max_depth=2)
+        misses = _is_definable_at_depth_cached.cache_info().misses
+        is_definable(Connective(2, OR.truth_table_int), [Connective(1, NOT.truth_table_int), AND],
+                     max_depth=2)
+        assert _is_definable_at_depth_cached.cache_info().misses == misses
+
+    def test_skips_intermediate_depths(self):
+        """Test that only depth 1 and the full depth are enumerated."""
+        clear_definability_cache()
+        majority = Connective(3, 0b11101000)
+        assert not is_definable(majority, [NAND], max_depth=3)
+        assert _is_definable_at_depth_cached.cache_info().currsize == 2
+
+    def test_clear_cache(self):
+        """Test that clearing empties the cache."""
+        is_definable(OR, [NOT, AND], max_depth=3)
+        clear_definability_cache()
+        assert _is_definable_at_depth_cached.cache_info().currsize == 0
+
+
+class TestPackedColumns:
+    """Test packed-column evaluation of binary compositions."""
+
+    def test_projections_reproduce_binary_tables(self):
+        """Test that f(x, y) over projection columns is f's own truth table."""
+        from src.constants import ALL_BINARY
+        for f in ALL_BINARY:
+            assert _apply_binary_columns(f.truth_table_int, _COLUMN_X, _COLUMN_Y) == f.truth_table_int
+
+    def test_unary_on_x_column(self):
+        """Test that NOT applied to the x column is NOT_X."""
+        from src.constants import NOT_X, NOT_Y
+        assert _apply_unary_column(NOT.truth_table_int, _COLUMN_X) == NOT_X.truth_table_int
+        assert _apply_unary_column(NOT.truth_table_int, _COLUMN_Y) == NOT_Y.truth_table_int
+
+    def test_compose_table_matches_evaluate(self):
+        """Test compose table entries against row-by-row evaluation."""
+        table = _binary_compose_table(XOR.truth_table_int)
+        for a in range(16):
+            for b in range(16):
+                expected = 0
+                for row in range(4):
+                    bit = XOR.evaluate(((a >> row) & 1, (b >> row) & 1))
+                    expected |= bit << row
+                assert table[a][b] == expected
+
+    def test_outer_composition_found(self):
+        """Test that OR(NOT(x), NOT(y)) yields NAND."""
+        assert _check_binary_outer_compositions(NAND, [OR], [NOT])
+
+    def test_outer_composition_requires_binary(self):
+        """Test that no binary outer function means no match."""
+        assert not _check_binary_outer_compositions(NAND, [], [NOT])
+
+    def test_unary_compose_table(self):
+        """Test that NOT's table complements every column."""
+        assert _unary_compose_table(NOT.truth_table_int) == tuple(c ^ 0b1111 for c in range(16))
+
+    def test_unary_outer_composition(self):
+        """Test that NOT(AND(x, y)) yields NAND."""
+        assert _check_unary_outer_compositions(NAND, [NOT], {AND.truth_table_int})
+        assert not _check_unary_outer_compositions(NAND, [NOT], {OR.truth_table_int})
+
+    def test_de_morgan_inner_columns(self):
+        """Test that AND(NOT(x), NOT(y)) is among the inner columns."""
+        columns = _binary_unary_unary_columns([AND], [NOT])
+        assert Connective(2, 0b0001).truth_table_int in columns
+        assert AND.truth_table_int in columns
+
+    def test_xor_from_or_and_not(self):
+        """Test that OR(x AND NOT y, NOT x AND y) yields XOR."""
+        inhibit = Connective(2, 0b0100)
+        conv_inhibit = Connective(2, 0b0010)
+        assert _check_binary_unary_binary_patterns(XOR, [OR, inhibit, conv_inhibit], [])
+        assert not _check_binary_unary_binary_patterns(XOR, [OR, AND], [])
+
+    def test_commutative_tables(self):
+        """Test detection of argument-symmetric binary tables."""
+        from src.constants import ALL_BINARY
+        for f in ALL_BINARY:
+            symmetric = all(f.evaluate((x, y)) == f.evaluate((y, x))
+                            for x in (0, 1) for y in (0, 1))
+            assert _is_commutative_table(f.truth_table_int) == symmetric
+
+    def test_unary_chain(self):
+        """Test that NOT(NOT(AND)) is found and needs a unary function."""
+        assert _check_unary_chain_binary(AND, [AND], [NOT])
+        assert not _check_unary_chain_binary(AND, [AND], [])
+
+    def test_f_proj_composed(self):
+        """Test that NAND(x, NAND(x, y)) yields IMP."""
+        from src.constants import IMPLIES
+        # NAND(x, NAND(x, y)) = NOT x OR (x AND y) = x -> y
+        assert _check_f_proj_composed(IMPLIES, [NAND])
+        assert not _check_f_proj_composed(XOR, [AND])
+
+    def test_projection_columns(self):
+        """Test projection columns for each arity."""
+        assert _projection_columns(0) == frozenset()
+        assert _projection_columns(2) == {_COLUMN_X, _COLUMN_Y}
+        assert _projection_columns(3) == {0b11110000, 0b11001100, 0b10101010}
+
+    def test_restrict_binary(self):
+        """Test reading binary tables at fixed rows."""
+        # AND(x, 1) = x, NAND(x, x) = NOT x
+        assert _restrict_binary(AND.truth_table_int, 1, 3) == 0b10
+        assert _restrict_binary(NAND.truth_table_int, 0, 3) == NOT.truth_table_int
+
+    def test_constant_signatures(self):
+        """Test that only all-0 and all-1 tables get a signature."""
+        assert _get_truth_function_signature(Connective(3, 0)) == "constant_0"
+        assert _get_truth_function_signature(Connective(3, 0xFF)) == "constant_1"
+        assert _get_truth_function_signature(AND) is None
+
+
+class TestCloneFilter:
+    """Test the Post-class necessary condition for definability."""
+
+    def test_monotone_basis_cannot_reach_not(self):
+        """Test that NOT escapes the monotone clone of {AND, OR}."""
+        assert _escapes_basis_clones(NOT, [AND, OR])
+
+    def test_target_inside_shared_clone(self):
+        """Test that OR lies in every clone containing AND."""
+        assert not _escapes_basis_clones(OR, [AND])
+
+    def test_complete_basis_has_no_shared_clone(self):
+        """Test that a complete basis never triggers the filter."""
+        assert not _escapes_basis_clones(XOR, [NAND])
+
+    def test_filter_skips_enumeration(self):
+        """Test that filtered queries never reach the depth checks."""
+        clear_definability_cache()
+        assert not is_definable(XOR, [AND, OR], max_depth=3)
+        assert _is_definable_at_depth_cached.cache_info().currsize == 0
+
+
+class TestDepthOne:
+    """Test depth-1 matching up to variable permutation."""
+
+    def test_converse_matches_by_permutation(self):
+        """Test that IMP matches CONV_IMP with swapped variables."""
+        from src.constants import IMPLIES, CONVERSE_IMP
+        assert _check_depth_one(IMPLIES, [AND, CONVERSE_IMP])
+
+    def test_no_match_without_permuted_copy(self):
+        """Test that a basis without a permuted copy does not match."""
+        from src.constants import IMPLIES, ALL_BINARY
+        basis = [b for b in ALL_BINARY if b.truth_table_int not in (11, 13)]
+        assert not _check_depth_one(IMPLIES, basis)
+
+    def test_ternary_orbit(self):
+        """Test that ternary permutations are matched."""
+        # f(x,y,z) = x AND NOT z; swapping x and z gives z AND NOT x
+        target = Connective(3, sum(1 << r for r in range(8) if (r >> 2) & 1 and not r & 1))
+        swapped = Connective(3, sum(1 << r for r in range(8) if r & 1 and not (r >> 2) & 1))
+        assert swapped.canonical_mask == target.canonical_mask
+        assert _check_depth_one(target, [AND, swapped])
+
+    def test_ignores_other_arities(self):
+        """Test that basis connectives of other arities are not compared."""
+        assert not _check_depth_one(NOT, [Connective(2, NOT.truth_table_int)])
+
 
 class TestKnownDependencies:
     """Test against known function dependencies."""
@@ -170,6 +381,50 @@ class TestKnownDependencies:
         assert is_definable(PROJECT_X, [AND], max_depth=3, mode=DefinabilityMode.TRUTH_FUNCTIONAL)
 
 
+class TestConstantPatterns:
+    """Test packed evaluation of binary patterns with constants."""
+
+    def test_nand_with_true_gives_not_y(self):
+        """Test that NAND(TRUE, y) yields NOT_Y."""
+        from src.constants import NOT_Y, CONST_TRUE
+        assert _check_binary_constant_patterns(NOT_Y, [NAND], [], [CONST_TRUE])
+
+    def test_constant_outside_composition(self):
+        """Test that XOR(AND(x, y), TRUE) yields NAND."""
+        from src.constants import CONST_TRUE
+        assert _check_binary_constant_patterns(NAND, [XOR, AND], [], [CONST_TRUE])
+        assert not _check_binary_constant_patterns(NAND, [XOR, AND], [], [Connective(0, 0)])
+
+    def test_requires_binary_function(self):
+        """Test that no binary outer function means no match."""
+        from src.constants import CONST_TRUE
+        assert not _check_binary_constant_patterns(NAND, [], [NOT], [CONST_TRUE])
+
+
+class TestTernaryCompositions:
+    """Test packed evaluation of ternary composition patterns."""
+
+    MAJORITY = Connective(3, 0b11101000)
+
+    def test_unary_on_ternary_column(self):
+        """Test that NOT applied to an 8-row column complements it."""
+        assert _apply_unary_column(NOT.truth_table_int, 0b11101000, 8) == 0b00010111
+
+    def test_negated_majority(self):
+        """Test that NOT(MAJ(x, y, z)) is found at depth 2."""
+        target = Connective(3, 0b00010111)
+        assert _check_ternary_compositions(target, [self.MAJORITY, NOT], 2)
+        assert not _check_ternary_compositions(target, [self.MAJORITY, NOT], 1)
+
+    def test_majority_with_negated_input(self):
+        """Test that MAJ(NOT x, y, z) is found at depth 2."""
+        # Rows are r = 4x + 2y + z; negating x swaps the two row halves
+        table = 0b11101000
+        target = Connective(3, ((table >> 4) | (table << 4)) & 0xFF)
+        assert _check_ternary_compositions(target, [self.MAJORITY, NOT], 2)
+        assert not _check_ternary_compositions(target, [self.MAJORITY], 2)
+
+
 class TestCompositionDepth:
     """Test behavior with different composition depths."""
 
@@ -11,8 +11,11 @@ from src.constants import (
 from src.post_classes import (
     is_t0_preserving, is_t1_preserving, is_monotone,
     is_self_dual, is_affine, get_post_class_membership,
-    is_complete, get_missing_classes, filter_by_post_classes
+    is_complete, get_missing_classes, filter_by_post_classes,
+    depends_on_all_variables, escape_bits, ALL_ESCAPE_BITS
 )
+from src.constants import IMPLIES, CONST_TRUE, CONST_FALSE
+from itertools import combinations
 
 
 class TestT0Preserving:
@@ -192,6 +195,70 @@ class TestAffine:
         assert is_affine(IFF)
 
 
+class TestPackedPredicates:
+    """Test bitmask predicates against row-by-row definitions."""
+
+    @staticmethod
+    def _rows(arity):
+        return [tuple((r >> (arity - 1 - k)) & 1 for k in range(arity))
+                for r in range(2 ** arity)]
+
+    def test_monotone_matches_definition(self):
+        """Test monotonicity on every ternary function."""
+        rows = self._rows(3)
+        for tt in range(256):
+            c = Connective(3, tt)
+            expected = all(c.evaluate(x) <= c.evaluate(y)
+                           for x in rows for y in rows
+                           if all(a <= b for a, b in zip(x, y)))
+            assert is_monotone(c) == expected
+
+    def test_self_dual_matches_definition(self):
+        """Test self-duality on every ternary function."""
+        for tt in range(256):
+            c = Connective(3, tt)
+            expected = all(c.evaluate(tuple(1 - v for v in x)) == 1 - c.evaluate(x)
+                           for x in self._rows(3))
+            assert is_self_dual(c) == expected
+
+    def test_affine_matches_definition(self):
+        """Test that exactly the 16 ternary affine functions are found."""
+        affine = set()
+        for coeffs in range(16):
+            tt = 0
+            for r, x in enumerate(self._rows(3)):
+                bit = (coeffs >> 3) & 1
+                for k in range(3):
+                    bit ^= ((coeffs >> k) & 1) & x[k]
+                tt |= bit << r
+            affine.add(tt)
+        assert {tt for tt in range(256) if is_affine(Connective(3, tt))} == affine
+
+    def test_nullary(self):
+        """Test constants: monotone and affine, never self-dual."""
+        for tt in (0, 1):
+            c = Connective(0, tt)
+            assert is_monotone(c) and is_affine(c)
+            assert not is_self_dual(c)
+            assert is_t0_preserving(c) == (tt == 0)
+            assert is_t1_preserving(c) == (tt == 1)
+
+
+class TestFictitiousVariables:
+    """Test detection of inputs that do not affect the output."""
+
+    def test_binary(self):
+        """Test projections and constants ignore a variable, AND does not."""
+        assert depends_on_all_variables(AND)
+        assert depends_on_all_variables(XOR)
+        assert not depends_on_all_variables(PROJECT_X)
+        assert not depends_on_all_variables(CONST_TRUE_BIN)
+
+    def test_ternary_count(self):
+        """Test that 218 ternary functions depend on all three inputs."""
+        assert sum(depends_on_all_variables(Connective(3, tt)) for tt in range(256)) == 218
+
+
 class TestPostClassMembership:
     """Test get_post_class_membership function."""
 
@@ -233,6 +300,34 @@ class TestPostClassMembership:
         assert 'T1' not in classes
         assert 'M' not in classes
 
+    def test_result_is_a_fresh_set(self):
+        """Test that mutating a returned set does not affect later calls."""
+        classes = get_post_class_membership(AND)
+        classes.add('D')
+        assert 'D' not in get_post_class_membership(AND)
+
+
+class TestEscapeBits:
+    """Test the escape masks used to decide completeness by OR."""
+
+    def test_sheffer_escapes_everything(self):
+        """NAND alone escapes all five classes."""
+        assert escape_bits(NAND) == ALL_ESCAPE_BITS
+
+    def test_and_escapes_only_self_dual_and_affine(self):
+        """AND preserves both constants and is monotone."""
+        assert escape_bits(AND) == 0b11000
+
+    def test_masks_agree_with_is_complete(self):
+        """ORing escape masks decides completeness exactly like is_complete."""
+        pool = [AND, OR, NOT, XOR, IMPLIES, IFF, CONST_TRUE, CONST_FALSE]
+        for size in range(1, 4):
+            for combo in combinations(pool, size):
+                escaped = 0
+                for c in combo:
+                    escaped |= escape_bits(c)
+                assert (escaped == ALL_ESCAPE_BITS) == is_complete(list(combo))
+
 
 class TestCompleteness:
     """Test completeness checking."""
@@ -403,6 +498,21 @@ class TestSymmetryBreaking:
         assert isinstance(and_canonical, int)
         assert 0 <= and_canonical <= 15
 
+    def test_equivalence_class_orbits(self):
+        """Test that AND with negated inputs shares AND's class, but NAND does not."""
+        from src.post_classes import equivalence_class_representative
+        # AND, x AND NOT y, NOT x AND y, NOR are one orbit under input negation
+        orbit = {equivalence_class_representative(Connective(2, tt))
+                 for tt in (0b1000, 0b0100, 0b0010, 0b0001)}
+        assert orbit == {0b0001}
+        assert equivalence_class_representative(NAND) == 0b0111
+
+    def test_ternary_class_count(self):
+        """Test the number of ternary classes under permutation and input negation."""
+        from src.post_classes import equivalence_class_representative
+        classes = {equivalence_class_representative(Connective(3, tt)) for tt in range(256)}
+        assert len(classes) == 22
+
     def test_filter_by_equivalence_reduces_binary(self):
         """Test that filtering reduces binary connectives."""
         from src.search import filter_by_equivalence
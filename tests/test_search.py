@@ -11,8 +11,11 @@ from src.search import (
     search_binary_only,
     search_incremental_arity,
     analyze_nice_set,
-    validate_nice_set
+    validate_nice_set,
+    _shard_prefixes
 )
+from itertools import combinations
+from math import comb
 
 
 class TestFindNiceSetsOfSize:
@@ -64,6 +67,34 @@ class TestFindNiceSetsOfSize:
         )
         assert not_or_found
 
+    def test_parallel_matches_sequential(self):
+        """Sharding over worker processes returns the sequential result."""
+        pool = [NOT, AND, OR, XOR, IMPLIES, IFF, CONST_TRUE, CONST_FALSE, NAND]
+        for size in (1, 2, 3):
+            expected = find_nice_sets_of_size(pool, size)
+            assert find_nice_sets_of_size(pool, size, processes=2) == expected
+
+
+class TestShardPrefixes:
+    """Test the prefix shards used by the parallel search."""
+
+    def test_shards_cover_combinations_in_order(self):
+        """Expanding the prefixes yields every combination in sequential order."""
+        n, size = 12, 4
+        expanded = [
+            prefix + rest
+            for prefix in _shard_prefixes(n, size, max_load=10)
+            for rest in combinations(range(prefix[-1] + 1, n), size - len(prefix))
+        ]
+        assert expanded == list(combinations(range(n), size))
+
+    def test_heavy_shards_are_split(self):
+        """No prefix holds more than max_load combinations once split."""
+        n, size = 20, 5
+        for prefix in _shard_prefixes(n, size, max_load=50):
+            if len(prefix) < size:
+                assert comb(n - prefix[-1] - 1, size - len(prefix)) <= 50
+
 
 class TestFindMaximumNiceSet:
     """Test finding maximum nice set size."""
@@ -246,3 +246,56 @@ class TestZ3Integration:
 
         # Result should be boolean (True = no nice sets, False = found nice sets)
         assert isinstance(result, bool)
+
+    def test_rlimit_stops_search(self, sample_connective_pool, capsys):
+        """Test that an exhausted resource limit is reported as inconclusive."""
+        from src.proofs.z3_proof import z3_proof_approach_1_symmetry_breaking
+
+        result = z3_proof_approach_1_symmetry_breaking(
+            pool=sample_connective_pool[:10],
+            target_size=3,
+            max_depth=2,
+            solver_rlimit=1
+        )
+
+        assert result is None
+        out = capsys.readouterr().out
+        assert "UNKNOWN" in out
+        assert "INCONCLUSIVE" in out
+        assert "NO SIZE-3 NICE SETS FOUND" not in out
+
+    def test_verify_completeness_keeps_result(self, sample_connective_pool):
+        """Test that the opt-in completeness re-check does not change the result."""
+        from src.proofs.z3_proof import z3_proof_approach_1_symmetry_breaking
+
+        results = [
+            z3_proof_approach_1_symmetry_breaking(
+                pool=sample_connective_pool[:10],
+                target_size=3,
+                max_depth=2,
+                verify_completeness=verify
+            )
+            for verify in (False, True)
+        ]
+        assert results[0] == results[1]
+
+    def test_solver_options_are_applied(self, sample_connective_pool):
+        """Test that solver options reach the Z3 solver."""
+        from src.proofs.z3_proof import z3_proof_approach_1_symmetry_breaking
+
+        result = z3_proof_approach_1_symmetry_breaking(
+            pool=sample_connective_pool[:10],
+            target_size=3,
+            max_depth=2,
+            solver_options={'random_seed': 7}
+        )
+        assert isinstance(result, bool)
+
+        from z3 import Z3Exception
+        with pytest.raises(Z3Exception):
+            z3_proof_approach_1_symmetry_breaking(
+                pool=sample_connective_pool[:10],
+                target_size=3,
+                max_depth=2,
+                solver_options={'smt.relevancy': 0}
+            )